@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from pydantic import BaseModel
 
-from app.models import FieldSpec, LayoutDoc
+from app.models import FieldSpec, LayoutDoc, LayoutPageText
 from app.routing import FIELD_ALIASES
 
 
@@ -39,9 +39,9 @@ def _get_field_keywords(field: FieldSpec) -> set[str]:
     return keywords
 
 
-def _page_contains_keyword(page_text: str, keywords: set[str]) -> bool:
+def _page_contains_keyword(page: LayoutPageText, keywords: set[str]) -> bool:
     """Check if page text contains any of the keywords."""
-    text_lower = page_text.lower()
+    text_lower = page.full_text_lower
     return any(kw in text_lower for kw in keywords)
 
 
@@ -89,7 +89,7 @@ def build_excerpts_for_field(
         # Find pages containing keywords
         matching_pages = [
             p for p in sorted_pages
-            if _page_contains_keyword(p.full_text, keywords)
+            if _page_contains_keyword(p, keywords)
         ]
 
         # If no matches, take first page
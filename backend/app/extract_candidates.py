@@ -13,6 +13,8 @@ import time
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
+from pydantic import TypeAdapter
+
 from app.excerpts import build_excerpts_for_field
 from app.heuristics import (
     extract_digits,
@@ -257,18 +259,22 @@ def _load_schema(run_paths: RunPaths) -> ResolvedSchema:
     return ResolvedSchema.model_validate(data)
 
 
+# Layout and routing are parsed and validated straight from JSON bytes by
+# pydantic-core, skipping the intermediate dicts and per-item model_validate
+_LAYOUT_LIST = TypeAdapter(list[LayoutDoc])
+_ROUTING_LIST = TypeAdapter(list[RoutingEntry])
+
+
 def _load_layout(run_paths: RunPaths) -> list[LayoutDoc]:
     """Load layout.json artifact."""
     path = run_paths.artifact_path("layout.json")
-    data = read_json(path)
-    return [LayoutDoc.model_validate(item) for item in data]
+    return _LAYOUT_LIST.validate_json(path.read_bytes())
 
 
 def _load_routing(run_paths: RunPaths) -> list[RoutingEntry]:
     """Load routing.json artifact."""
     path = run_paths.artifact_path("routing.json")
-    data = read_json(path)
-    return [RoutingEntry.model_validate(item) for item in data]
+    return _ROUTING_LIST.validate_json(path.read_bytes())
 
 
 def _get_routed_docs(
@@ -8,13 +8,14 @@ doc_id, page, and exact quoted_text.
 
 from __future__ import annotations
 
+import functools
 import re
-from typing import Callable
+from typing import Any, Callable, Iterator
+
+from pydantic import TypeAdapter
 
 from app.models import (
     Candidate,
-    CandidateScores,
-    Evidence,
     FieldSpec,
     LayoutDoc,
 )
@@ -23,6 +24,45 @@ from app.models import (
 # --- Normalization helpers (deterministic) ---
 
 
+_RE_NON_WORD = re.compile(r"[^\w\s\-]")
+
+# ASCII equivalent of _RE_NON_WORD as a str.translate table: deletes every
+# ASCII character that is not a word character, whitespace or hyphen
+_ASCII_NON_WORD_DELETE = str.maketrans({
+    c: None
+    for c in map(chr, range(128))
+    if not (c.isalnum() or c == "_" or c.isspace() or c == "-")
+})
+_RE_NON_DIGIT = re.compile(r"\D")
+
+# ASCII equivalent of _RE_NON_DIGIT: deletes every ASCII non-digit
+_ASCII_NON_DIGIT_DELETE = str.maketrans({
+    c: None for c in map(chr, range(128)) if not c.isdigit()
+})
+
+# Every date format and phone pattern contains a run of four digits
+_RE_FOUR_DIGITS = re.compile(r"\d{4}")
+
+# Anchored date formats accepted by normalize_date
+_RE_ISO_DATE = re.compile(r"(\d{4})[-/](\d{1,2})[-/](\d{1,2})")
+_RE_US_DATE = re.compile(r"(\d{1,2})[-/](\d{1,2})[-/](\d{4})")
+_RE_MONTH_DAY_YEAR = re.compile(r"([a-zA-Z]+)\s*(\d{1,2}),?\s*(\d{4})", re.IGNORECASE)
+_RE_DAY_MONTH_YEAR = re.compile(r"(\d{1,2})\s+([a-zA-Z]+)\s+(\d{4})", re.IGNORECASE)
+
+# Bound on memoized normalizer results; the same raw strings recur across
+# overlapping pattern matches, routed documents and evidence checks
+_NORMALIZE_CACHE_SIZE = 4096
+
+_MONTHS = {
+    "january": 1, "february": 2, "march": 3, "april": 4,
+    "may": 5, "june": 6, "july": 7, "august": 8,
+    "september": 9, "october": 10, "november": 11, "december": 12,
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+
+@functools.lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_text(text: str) -> str:
     """
     Normalize text for comparison.
@@ -33,19 +73,22 @@ def normalize_text(text: str) -> str:
     - Strip punctuation except hyphens (for dates/phones)
     - Strip leading/trailing whitespace
     """
-    # Lowercase
-    text = text.lower()
-
-    # Collapse whitespace
-    text = re.sub(r"\s+", " ", text)
-
-    # Strip punctuation except hyphens
-    text = re.sub(r"[^\w\s\-]", "", text)
+    # Lowercase, then collapse whitespace (str.split uses the same Unicode
+    # whitespace definition as \s)
+    text = " ".join(text.lower().split())
+
+    # Strip punctuation except hyphens; the translate table covers ASCII,
+    # other text keeps the regex for Unicode word-character semantics
+    if text.isascii():
+        text = text.translate(_ASCII_NON_WORD_DELETE)
+    else:
+        text = _RE_NON_WORD.sub("", text)
 
     # Strip leading/trailing whitespace
     return text.strip()
 
 
+@functools.lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_date(raw: str) -> str | None:
     """
     Normalize a date string to YYYY-MM-DD format.
@@ -58,52 +101,46 @@ def normalize_date(raw: str) -> str | None:
 
     Returns None if parsing fails.
     """
+    # Every format has a four-digit year; most non-dates are rejected here
+    if not _RE_FOUR_DIGITS.search(raw):
+        return None
+
+    # Month-name-first is the only format not starting with a digit (\d is
+    # Unicode Nd, matching str.isdecimal), so try only the formats that can
+    if not raw[:1].isdecimal():
+        # Try Month DD, YYYY or Month DD YYYY
+        match = _RE_MONTH_DAY_YEAR.match(raw)
+        if match:
+            month_str, day, year = match.groups()
+            month_num = _MONTHS.get(month_str.lower())
+            if month_num:
+                return f"{year}-{month_num:02d}-{int(day):02d}"
+        return None
+
     # Try YYYY-MM-DD or YYYY/MM/DD
-    match = re.match(r"(\d{4})[-/](\d{1,2})[-/](\d{1,2})", raw)
+    match = _RE_ISO_DATE.match(raw)
     if match:
         year, month, day = match.groups()
         return f"{year}-{int(month):02d}-{int(day):02d}"
 
     # Try MM/DD/YYYY or MM-DD-YYYY
-    match = re.match(r"(\d{1,2})[-/](\d{1,2})[-/](\d{4})", raw)
+    match = _RE_US_DATE.match(raw)
     if match:
         month, day, year = match.groups()
         return f"{year}-{int(month):02d}-{int(day):02d}"
 
-    # Try Month DD, YYYY or Month DD YYYY
-    months = {
-        "january": 1, "february": 2, "march": 3, "april": 4,
-        "may": 5, "june": 6, "july": 7, "august": 8,
-        "september": 9, "october": 10, "november": 11, "december": 12,
-        "jan": 1, "feb": 2, "mar": 3, "apr": 4, "jun": 6,
-        "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
-    }
-    match = re.match(
-        r"([a-zA-Z]+)\s*(\d{1,2}),?\s*(\d{4})",
-        raw,
-        re.IGNORECASE,
-    )
-    if match:
-        month_str, day, year = match.groups()
-        month_num = months.get(month_str.lower())
-        if month_num:
-            return f"{year}-{month_num:02d}-{int(day):02d}"
-
     # Try DD Month YYYY
-    match = re.match(
-        r"(\d{1,2})\s+([a-zA-Z]+)\s+(\d{4})",
-        raw,
-        re.IGNORECASE,
-    )
+    match = _RE_DAY_MONTH_YEAR.match(raw)
     if match:
         day, month_str, year = match.groups()
-        month_num = months.get(month_str.lower())
+        month_num = _MONTHS.get(month_str.lower())
         if month_num:
             return f"{year}-{month_num:02d}-{int(day):02d}"
 
     return None
 
 
+@functools.lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_phone(raw: str) -> tuple[str, bool]:
     """
     Normalize a phone number to digits only.
@@ -112,7 +149,7 @@ def normalize_phone(raw: str) -> tuple[str, bool]:
     If the phone has fewer than 11 digits, assumes +1 country code.
     """
     # Extract digits only
-    digits = re.sub(r"\D", "", raw)
+    digits = extract_digits(raw)
 
     # Check if country code is present
     default_country_assumed = False
@@ -131,7 +168,10 @@ def normalize_phone(raw: str) -> tuple[str, bool]:
 
 def extract_digits(text: str) -> str:
     """Extract only digits from text."""
-    return re.sub(r"\D", "", text)
+    if text.isascii():
+        return text.translate(_ASCII_NON_DIGIT_DELETE)
+    # \d also matches non-ASCII decimal digits
+    return _RE_NON_DIGIT.sub("", text)
 
 
 # --- Pattern-based extractors ---
@@ -167,6 +207,81 @@ PHONE_PATTERNS = [
 INSURANCE_KEYWORDS = ["member", "policy", "id", "insurance", "subscriber", "group"]
 INSURANCE_ID_PATTERN = r"\b[A-Za-z0-9]{4,20}\b"
 
+# Keywords that suggest DOB / phone context
+DOB_KEYWORDS = ["dob", "date of birth", "birthdate", "birth date", "born"]
+PHONE_KEYWORDS = ["phone", "mobile", "telephone", "tel", "cell", "contact"]
+
+# Label patterns for line-based extractors
+NAME_PATTERNS = [
+    r"(?:patient\s+)?name\s*:\s*(.+)",
+    r"full\s+name\s*:\s*(.+)",
+    r"patient\s*:\s*(.+)",
+]
+ADDRESS_PATTERNS = [
+    r"address\s*:\s*(.+)",
+    r"street\s*:\s*(.+)",
+    r"mailing\s+address\s*:\s*(.+)",
+    r"home\s+address\s*:\s*(.+)",
+]
+ALLERGY_KEYWORDS = ["allergies", "allergy", "allergic to", "known allergies"]
+MEDICATION_KEYWORDS = ["medications", "meds", "current medications", "prescriptions", "rx"]
+
+
+def _keyword_alternation(keywords: list[str]) -> re.Pattern[str]:
+    """Compile a pattern matching any of the given literal keywords."""
+    return re.compile("|".join(re.escape(kw) for kw in keywords))
+
+
+def _keyword_value_pattern(keywords: list[str]) -> re.Pattern[str]:
+    """Compile a case-insensitive `<keyword>: <value>` pattern for a list field."""
+    keyword_pattern = "|".join(re.escape(kw) for kw in keywords)
+    return re.compile(rf"(?:{keyword_pattern})\s*:\s*(.+)", re.IGNORECASE)
+
+
+def _label_gate(labels: list[str]) -> re.Pattern[str]:
+    """
+    Compile a single-line `<label>:` pattern used to find candidate lines.
+
+    Every label pattern of a line-based extractor contains one of the given
+    labels followed by a colon, so a line without a gate match cannot yield
+    a candidate. Whitespace in the gate never spans a newline.
+    """
+    alternation = "|".join(re.escape(label) for label in labels)
+    return re.compile(rf"(?:{alternation})[^\S\n]*:", re.IGNORECASE)
+
+
+# Compiled once at import; extractors call methods on these directly
+_RE_DATES = tuple(re.compile(p, re.IGNORECASE) for p in DATE_PATTERNS)
+_RE_PHONES = tuple(re.compile(p) for p in PHONE_PATTERNS)
+_RE_INSURANCE_ID = re.compile(INSURANCE_ID_PATTERN)
+_RE_NAMES = tuple(re.compile(p, re.IGNORECASE) for p in NAME_PATTERNS)
+_RE_ADDRESSES = tuple(re.compile(p, re.IGNORECASE) for p in ADDRESS_PATTERNS)
+_RE_ALLERGIES = _keyword_value_pattern(ALLERGY_KEYWORDS)
+_RE_MEDICATIONS = _keyword_value_pattern(MEDICATION_KEYWORDS)
+
+# Anchor keywords compiled into one literal alternation each, so the anchor
+# check is a single search over the context window instead of one substring
+# scan per keyword. Matched against lowercased text.
+_RE_DOB_ANCHOR = _keyword_alternation(DOB_KEYWORDS)
+_RE_PHONE_ANCHOR = _keyword_alternation(PHONE_KEYWORDS)
+_RE_INSURANCE_ANCHOR = _keyword_alternation(INSURANCE_KEYWORDS)
+
+# Characters before a match searched for an anchor keyword
+_ANCHOR_WINDOW = 50
+
+# Single-pass gates: one scan per page selects the lines (or pages) worth
+# running the full pattern set against
+_RE_NAME_GATE = _label_gate(["name", "patient"])
+_RE_ADDRESS_GATE = _label_gate(["address", "street"])
+_RE_ALLERGIES_GATE = _label_gate(ALLERGY_KEYWORDS)
+_RE_MEDICATIONS_GATE = _label_gate(MEDICATION_KEYWORDS)
+
+# Stripped from the end of extracted names. str.rstrip is linear, whereas
+# a `[...]+$` regex rescans the run from every start position (quadratic).
+_TRAILING_PUNCT = ",;:.|"
+
+_INSURANCE_STOPWORDS = frozenset({"member", "policy", "insurance", "group", "subscriber"})
+
 
 def _find_line_containing(text: str, match_start: int) -> str:
     """Find the full line containing a match position."""
@@ -185,23 +300,87 @@ def _find_line_containing(text: str, match_start: int) -> str:
     return text[line_start:line_end].strip()
 
 
+def _has_anchor_before(anchor: re.Pattern[str], text_lower: str, match_pos: int) -> bool:
+    """
+    Check for an anchor keyword in the window preceding a match.
+
+    Searches text_lower[match_pos - _ANCHOR_WINDOW:match_pos] in place via
+    the pos/endpos arguments, so no context slice is allocated.
+    """
+    context_start = max(0, match_pos - _ANCHOR_WINDOW)
+    return anchor.search(text_lower, context_start, match_pos) is not None
+
+
+def _gated_lines(text: str, gate: re.Pattern[str]) -> Iterator[str]:
+    """
+    Yield each line of text containing a gate match, once and in order.
+
+    Equivalent to filtering text.split("\n") by gate.search, but walks the
+    page once instead of splitting it and scanning every line.
+    """
+    line_end = -1
+    for hit in gate.finditer(text):
+        if hit.start() < line_end:
+            continue  # Same line as the previous hit
+        line_start = text.rfind("\n", 0, hit.start()) + 1
+        line_end = text.find("\n", hit.start())
+        if line_end == -1:
+            line_end = len(text)
+        yield text[line_start:line_end]
+
+
+# --- Candidate materialization ---
+
+
+# Extractors emit plain rows; heuristic_candidates_for_field validates all
+# rows for a field in one pydantic-core call instead of constructing
+# Candidate, Evidence and CandidateScores per match
+_CandidateRow = dict[str, Any]
+_Extractor = Callable[[FieldSpec, LayoutDoc], list[_CandidateRow]]
+
+_CANDIDATE_LIST = TypeAdapter(list[Candidate])
+
+
+def _candidate_row(
+    field_key: str,
+    doc_id: str,
+    page: int,
+    *,
+    raw_value: str,
+    normalized_value: str,
+    quoted_text: str,
+    anchor_match: float,
+    validators: list[str] | None = None,
+) -> _CandidateRow:
+    """Build the plain-data form of a heuristic Candidate with one Evidence span."""
+    return {
+        "field": field_key,
+        "raw_value": raw_value,
+        "normalized_value": normalized_value,
+        "evidence": [{"doc_id": doc_id, "page": page, "quoted_text": quoted_text}],
+        "from_method": "heuristic",
+        "validators": validators if validators is not None else [],
+        "rejected_reasons": [],
+        "scores": {"anchor_match": anchor_match, "validator": 0.0, "doc_relevance": 0.0},
+    }
+
+
 def _extract_dob_candidates(
     field: FieldSpec,
     doc: LayoutDoc,
-) -> list[Candidate]:
-    """Extract DOB candidates from a document."""
-    candidates: list[Candidate] = []
+) -> list[_CandidateRow]:
+    """Extract DOB candidate rows from a document."""
+    rows: list[_CandidateRow] = []
     seen_values: set[str] = set()
 
-    # Keywords that suggest DOB context
-    dob_keywords = ["dob", "date of birth", "birthdate", "birth date", "born"]
-
     for page in doc.pages:
         text = page.full_text
-        text_lower = text.lower()
+        if not _RE_FOUR_DIGITS.search(text):
+            continue
+        text_lower = page.full_text_lower
 
-        for pattern in DATE_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for pattern in _RE_DATES:
+            for match in pattern.finditer(text):
                 raw_value = match.group(0).strip()
                 normalized = normalize_date(raw_value)
 
@@ -211,58 +390,46 @@ def _extract_dob_candidates(
                 if normalized in seen_values:
                     continue
 
-                # Check if near a DOB keyword for anchor scoring
                 match_pos = match.start()
-                context_start = max(0, match_pos - 50)
-                context = text_lower[context_start:match_pos]
-                has_anchor = any(kw in context for kw in dob_keywords)
 
                 # Get the line as evidence
                 quoted_text = _find_line_containing(text, match_pos)
 
-                if not quoted_text.strip():
+                if not quoted_text:
                     continue
 
                 seen_values.add(normalized)
 
-                candidates.append(Candidate(
-                    field=field.key,
+                # Anchor scoring runs once per emitted candidate
+                has_anchor = _has_anchor_before(_RE_DOB_ANCHOR, text_lower, match_pos)
+
+                rows.append(_candidate_row(
+                    field.key, doc.doc_id, page.page,
                     raw_value=raw_value,
                     normalized_value=normalized,
-                    evidence=[Evidence(
-                        doc_id=doc.doc_id,
-                        page=page.page,
-                        quoted_text=quoted_text,
-                    )],
-                    from_method="heuristic",
-                    validators=[],
-                    rejected_reasons=[],
-                    scores=CandidateScores(
-                        anchor_match=1.0 if has_anchor else 0.0,
-                        validator=0.0,
-                        doc_relevance=0.0,
-                    ),
+                    quoted_text=quoted_text,
+                    anchor_match=1.0 if has_anchor else 0.0,
                 ))
 
-    return candidates
+    return rows
 
 
 def _extract_phone_candidates(
     field: FieldSpec,
     doc: LayoutDoc,
-) -> list[Candidate]:
-    """Extract phone candidates from a document."""
-    candidates: list[Candidate] = []
+) -> list[_CandidateRow]:
+    """Extract phone candidate rows from a document."""
+    rows: list[_CandidateRow] = []
     seen_values: set[str] = set()
 
-    phone_keywords = ["phone", "mobile", "telephone", "tel", "cell", "contact"]
-
     for page in doc.pages:
         text = page.full_text
-        text_lower = text.lower()
+        if not _RE_FOUR_DIGITS.search(text):
+            continue
+        text_lower = page.full_text_lower
 
-        for pattern in PHONE_PATTERNS:
-            for match in re.finditer(pattern, text):
+        for pattern in _RE_PHONES:
+            for match in pattern.finditer(text):
                 raw_value = match.group(0).strip()
                 normalized, default_country = normalize_phone(raw_value)
 
@@ -273,74 +440,59 @@ def _extract_phone_candidates(
                 if normalized in seen_values:
                     continue
 
-                # Check anchor
                 match_pos = match.start()
-                context_start = max(0, match_pos - 50)
-                context = text_lower[context_start:match_pos]
-                has_anchor = any(kw in context for kw in phone_keywords)
 
                 quoted_text = _find_line_containing(text, match_pos)
 
-                if not quoted_text.strip():
+                if not quoted_text:
                     continue
 
                 seen_values.add(normalized)
 
+                # Anchor scoring runs once per emitted candidate
+                has_anchor = _has_anchor_before(_RE_PHONE_ANCHOR, text_lower, match_pos)
+
                 validators: list[str] = []
                 if default_country:
                     validators.append("default_country_assumed")
 
-                candidates.append(Candidate(
-                    field=field.key,
+                rows.append(_candidate_row(
+                    field.key, doc.doc_id, page.page,
                     raw_value=raw_value,
                     normalized_value=normalized,
-                    evidence=[Evidence(
-                        doc_id=doc.doc_id,
-                        page=page.page,
-                        quoted_text=quoted_text,
-                    )],
-                    from_method="heuristic",
+                    quoted_text=quoted_text,
+                    anchor_match=1.0 if has_anchor else 0.0,
                     validators=validators,
-                    rejected_reasons=[],
-                    scores=CandidateScores(
-                        anchor_match=1.0 if has_anchor else 0.0,
-                        validator=0.0,
-                        doc_relevance=0.0,
-                    ),
                 ))
 
-    return candidates
+    return rows
 
 
 def _extract_insurance_id_candidates(
     field: FieldSpec,
     doc: LayoutDoc,
-) -> list[Candidate]:
-    """Extract insurance member ID candidates from a document."""
-    candidates: list[Candidate] = []
+) -> list[_CandidateRow]:
+    """Extract insurance member ID candidate rows from a document."""
+    rows: list[_CandidateRow] = []
     seen_values: set[str] = set()
 
     for page in doc.pages:
-        text = page.full_text
-        text_lower = text.lower()
-
-        # Find lines containing insurance keywords
-        lines = text.split("\n")
-        line_start = 0
+        # Find lines containing insurance keywords (lowercasing never adds
+        # or removes newlines, so the two splits line up)
+        lines = zip(page.full_text.split("\n"), page.full_text_lower.split("\n"))
 
-        for line in lines:
-            line_lower = line.lower()
-            has_keyword = any(kw in line_lower for kw in INSURANCE_KEYWORDS)
+        for line, line_lower in lines:
+            has_keyword = _RE_INSURANCE_ANCHOR.search(line_lower) is not None
 
             if has_keyword:
                 # Look for alphanumeric IDs in this line
-                for match in re.finditer(INSURANCE_ID_PATTERN, line):
+                for match in _RE_INSURANCE_ID.finditer(line):
                     raw_value = match.group(0)
 
                     # Skip if it looks like a date or common word
                     if normalize_date(raw_value) is not None:
                         continue
-                    if raw_value.lower() in {"member", "policy", "insurance", "group", "subscriber"}:
+                    if raw_value.lower() in _INSURANCE_STOPWORDS:
                         continue
 
                     normalized = normalize_text(raw_value)
@@ -353,129 +505,80 @@ def _extract_insurance_id_candidates(
 
                     seen_values.add(normalized)
 
-                    candidates.append(Candidate(
-                        field=field.key,
+                    rows.append(_candidate_row(
+                        field.key, doc.doc_id, page.page,
                         raw_value=raw_value,
                         normalized_value=normalized,
-                        evidence=[Evidence(
-                            doc_id=doc.doc_id,
-                            page=page.page,
-                            quoted_text=line.strip(),
-                        )],
-                        from_method="heuristic",
-                        validators=[],
-                        rejected_reasons=[],
-                        scores=CandidateScores(
-                            anchor_match=1.0,  # Found near keyword
-                            validator=0.0,
-                            doc_relevance=0.0,
-                        ),
+                        quoted_text=line.strip(),
+                        anchor_match=1.0,
                     ))
 
-            line_start += len(line) + 1
+    return rows
 
-    return candidates
 
+# Cleans a captured label value; returns None to reject it
+_ValueCleaner = Callable[[str], str | None]
 
-def _extract_name_candidates(
-    field: FieldSpec,
-    doc: LayoutDoc,
-) -> list[Candidate]:
-    """Extract full name candidates from a document."""
-    candidates: list[Candidate] = []
-    seen_values: set[str] = set()
 
-    name_patterns = [
-        r"(?:patient\s+)?name\s*:\s*(.+)",
-        r"full\s+name\s*:\s*(.+)",
-        r"patient\s*:\s*(.+)",
-    ]
+def _clean_name(raw_value: str) -> str | None:
+    """Strip trailing punctuation; reject too short/long or mostly-digit names."""
+    raw_value = raw_value.rstrip(_TRAILING_PUNCT).strip()
 
-    for page in doc.pages:
-        text = page.full_text
+    if len(raw_value) < 2 or len(raw_value) > 100:
+        return None
 
-        for line in text.split("\n"):
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
+    # Skip if mostly digits
+    digit_ratio = sum(c.isdigit() for c in raw_value) / len(raw_value)
+    if digit_ratio > 0.5:
+        return None
 
-            for pattern in name_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    raw_value = match.group(1).strip()
+    return raw_value
 
-                    # Clean up: remove trailing punctuation, limit length
-                    raw_value = re.sub(r"[,;:\.\|]+$", "", raw_value).strip()
 
-                    if len(raw_value) < 2 or len(raw_value) > 100:
-                        continue
+def _clean_address(raw_value: str) -> str | None:
+    """Reject addresses shorter than 5 characters."""
+    return raw_value if len(raw_value) >= 5 else None
 
-                    # Skip if mostly digits
-                    digit_ratio = sum(c.isdigit() for c in raw_value) / len(raw_value)
-                    if digit_ratio > 0.5:
-                        continue
 
-                    normalized = normalize_text(raw_value)
-
-                    if normalized in seen_values:
-                        continue
-
-                    if not normalized:
-                        continue
-
-                    seen_values.add(normalized)
-
-                    candidates.append(Candidate(
-                        field=field.key,
-                        raw_value=raw_value,
-                        normalized_value=normalized,
-                        evidence=[Evidence(
-                            doc_id=doc.doc_id,
-                            page=page.page,
-                            quoted_text=line_stripped,
-                        )],
-                        from_method="heuristic",
-                        validators=[],
-                        rejected_reasons=[],
-                        scores=CandidateScores(
-                            anchor_match=1.0,
-                            validator=0.0,
-                            doc_relevance=0.0,
-                        ),
-                    ))
+def _clean_list_value(raw_value: str) -> str | None:
+    """Reject list values shorter than 2 characters (kept as a string)."""
+    return raw_value if len(raw_value) >= 2 else None
 
-    return candidates
 
+def _make_label_extractor(
+    patterns: tuple[re.Pattern[str], ...],
+    gate: re.Pattern[str],
+    clean_value: _ValueCleaner,
+) -> _Extractor:
+    """
+    Build a line-based `<label>: <value>` extractor.
 
-def _extract_address_candidates(
-    field: FieldSpec,
-    doc: LayoutDoc,
-) -> list[Candidate]:
-    """Extract address candidates from a document."""
-    candidates: list[Candidate] = []
-    seen_values: set[str] = set()
+    The patterns, gate and cleaner are bound in the returned closure, so
+    each field gets its own specialized extractor without per-call dispatch.
 
-    address_patterns = [
-        r"address\s*:\s*(.+)",
-        r"street\s*:\s*(.+)",
-        r"mailing\s+address\s*:\s*(.+)",
-        r"home\s+address\s*:\s*(.+)",
-    ]
+    Args:
+        patterns: Label patterns tried in order on each line; group 1 is the value.
+        gate: Single-line pattern that every matching line must contain.
+        clean_value: Post-processes the stripped value, or rejects it with None.
 
-    for page in doc.pages:
-        text = page.full_text
+    Returns:
+        Extractor producing candidate rows anchored to the matching line.
+    """
+    def extract(field: FieldSpec, doc: LayoutDoc) -> list[_CandidateRow]:
+        rows: list[_CandidateRow] = []
+        seen_values: set[str] = set()
 
-        for line in text.split("\n"):
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
+        for page in doc.pages:
+            for line in _gated_lines(page.full_text, gate):
+                line_stripped = line.strip()
 
-            for pattern in address_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    raw_value = match.group(1).strip()
+                for pattern in patterns:
+                    match = pattern.search(line)
+                    if not match:
+                        continue
 
-                    if len(raw_value) < 5:
+                    raw_value = clean_value(match.group(1).strip())
+                    if raw_value is None:
                         continue
 
                     normalized = normalize_text(raw_value)
@@ -488,113 +591,31 @@ def _extract_address_candidates(
 
                     seen_values.add(normalized)
 
-                    candidates.append(Candidate(
-                        field=field.key,
+                    rows.append(_candidate_row(
+                        field.key, doc.doc_id, page.page,
                         raw_value=raw_value,
                         normalized_value=normalized,
-                        evidence=[Evidence(
-                            doc_id=doc.doc_id,
-                            page=page.page,
-                            quoted_text=line_stripped,
-                        )],
-                        from_method="heuristic",
-                        validators=[],
-                        rejected_reasons=[],
-                        scores=CandidateScores(
-                            anchor_match=1.0,
-                            validator=0.0,
-                            doc_relevance=0.0,
-                        ),
-                    ))
-
-    return candidates
-
-
-def _extract_list_field_candidates(
-    field: FieldSpec,
-    doc: LayoutDoc,
-    keywords: list[str],
-) -> list[Candidate]:
-    """Extract list-type field candidates (allergies, medications)."""
-    candidates: list[Candidate] = []
-    seen_values: set[str] = set()
-
-    # Build pattern from keywords
-    keyword_pattern = "|".join(re.escape(kw) for kw in keywords)
-    pattern = rf"(?:{keyword_pattern})\s*:\s*(.+)"
-
-    for page in doc.pages:
-        text = page.full_text
-
-        for line in text.split("\n"):
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
-
-            match = re.search(pattern, line, re.IGNORECASE)
-            if match:
-                raw_value = match.group(1).strip()
-
-                if len(raw_value) < 2:
-                    continue
-
-                # Keep as string (spec allows string or list, we use string)
-                normalized = normalize_text(raw_value)
-
-                if normalized in seen_values:
-                    continue
-
-                if not normalized:
-                    continue
-
-                seen_values.add(normalized)
-
-                candidates.append(Candidate(
-                    field=field.key,
-                    raw_value=raw_value,
-                    normalized_value=normalized,
-                    evidence=[Evidence(
-                        doc_id=doc.doc_id,
-                        page=page.page,
                         quoted_text=line_stripped,
-                    )],
-                    from_method="heuristic",
-                    validators=[],
-                    rejected_reasons=[],
-                    scores=CandidateScores(
                         anchor_match=1.0,
-                        validator=0.0,
-                        doc_relevance=0.0,
-                    ),
-                ))
+                    ))
 
-    return candidates
+        return rows
 
-
-def _extract_allergies_candidates(
-    field: FieldSpec,
-    doc: LayoutDoc,
-) -> list[Candidate]:
-    """Extract allergies candidates."""
-    return _extract_list_field_candidates(
-        field, doc,
-        keywords=["allergies", "allergy", "allergic to", "known allergies"],
-    )
+    return extract
 
 
-def _extract_medications_candidates(
-    field: FieldSpec,
-    doc: LayoutDoc,
-) -> list[Candidate]:
-    """Extract medications candidates."""
-    return _extract_list_field_candidates(
-        field, doc,
-        keywords=["medications", "meds", "current medications", "prescriptions", "rx"],
-    )
+_extract_name_candidates = _make_label_extractor(_RE_NAMES, _RE_NAME_GATE, _clean_name)
+_extract_address_candidates = _make_label_extractor(_RE_ADDRESSES, _RE_ADDRESS_GATE, _clean_address)
+_extract_allergies_candidates = _make_label_extractor(
+    (_RE_ALLERGIES,), _RE_ALLERGIES_GATE, _clean_list_value,
+)
+_extract_medications_candidates = _make_label_extractor(
+    (_RE_MEDICATIONS,), _RE_MEDICATIONS_GATE, _clean_list_value,
+)
 
 
 # Extractor dispatch table
-_EXTRACTORS: dict[str, Callable[[FieldSpec, LayoutDoc], list[Candidate]]] = {
+_EXTRACTORS: dict[str, _Extractor] = {
     "dob": _extract_dob_candidates,
     "phone": _extract_phone_candidates,
     "insurance_member_id": _extract_insurance_id_candidates,
@@ -628,11 +649,11 @@ def heuristic_candidates_for_field(
         # Unknown field type - return empty
         return []
 
-    all_candidates: list[Candidate] = []
+    # Deduplication stays per document; rows are materialized once
+    rows: list[_CandidateRow] = []
 
     for doc in routed_docs:
-        candidates = extractor(field, doc)
-        all_candidates.extend(candidates)
+        rows.extend(extractor(field, doc))
 
-    return all_candidates
+    return _CANDIDATE_LIST.validate_python(rows)
 
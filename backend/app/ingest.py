@@ -12,25 +12,37 @@ from __future__ import annotations
 
 import hashlib
 import mimetypes
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from app.models import DocIndexItem
+from app.pdf_text import is_pdf_bytes
 
 if TYPE_CHECKING:
     from app.runfs import RunPaths
 
 
-# PDF magic bytes
-_PDF_MAGIC = b"%PDF"
+# Extensions resolved without consulting mimetypes (the common upload types)
+_EXT_MIME = {
+    ".pdf": "application/pdf",
+    ".txt": "text/plain",
+}
+
+# Header bytes read when the extension is not recognized
+_MAGIC_READ_SIZE = 8
+
+# Upper bound on concurrent file writes/hashes during ingest
+_MAX_INGEST_WORKERS = 8
 
 
 def _detect_mime_type(filepath: Path) -> str:
     """
     Detect MIME type of a file.
 
-    Uses mimetypes module for extension-based detection,
-    with fallback to PDF header sniff for .pdf files or unknowns.
+    Uses a fixed map for common extensions, then the mimetypes module,
+    with fallback to a magic-byte sniff (PDF header) for unknowns.
 
     Args:
         filepath: Path to the file.
@@ -39,19 +51,23 @@ def _detect_mime_type(filepath: Path) -> str:
         MIME type string (e.g., "application/pdf", "text/plain").
     """
     # Try extension-based detection first
-    mime_type, _ = mimetypes.guess_type(str(filepath))
+    mime_type = _EXT_MIME.get(filepath.suffix.lower())
+    if mime_type:
+        return mime_type
 
+    mime_type, _ = mimetypes.guess_type(str(filepath))
     if mime_type:
         return mime_type
 
-    # Fallback: check for PDF magic bytes
+    # Fallback: check for known magic bytes
     try:
         with open(filepath, "rb") as f:
-            header = f.read(8)
-        if header.startswith(_PDF_MAGIC):
-            return "application/pdf"
+            header = f.read(_MAGIC_READ_SIZE)
     except OSError:
-        pass
+        header = b""
+
+    if is_pdf_bytes(header):
+        return "application/pdf"
 
     # Default fallback
     return "application/octet-stream"
@@ -61,17 +77,22 @@ def _compute_sha256(filepath: Path) -> str:
     """
     Compute SHA256 hash of a file.
 
+    Maps the file into memory so the digest reads straight from the page
+    cache. Empty files (which cannot be mapped) and files mmap rejects
+    fall back to a buffered hashlib.file_digest.
+
     Args:
         filepath: Path to the file.
 
     Returns:
         Lowercase hex digest of SHA256 hash.
     """
-    h = hashlib.sha256()
     with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return hashlib.sha256(mapped).hexdigest()
+        except (ValueError, OSError):
+            return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def _format_doc_id(index: int) -> str:
@@ -87,6 +108,28 @@ def _format_doc_id(index: int) -> str:
     return f"doc_{index + 1:03d}"
 
 
+def _ingest_file(dest_path: Path, content: bytes) -> tuple[str, str]:
+    """
+    Write one input document (unless already present) and inspect it.
+
+    Args:
+        dest_path: Destination path under input_docs/.
+        content: Uploaded file bytes.
+
+    Returns:
+        Tuple of (sha256, mime_type) of the file on disk.
+    """
+    if dest_path.exists():
+        # Already ingested (e.g. re-run): hash what is actually on disk
+        sha256 = _compute_sha256(dest_path)
+    else:
+        # Hash the bytes just written instead of reading the file back
+        dest_path.write_bytes(content)
+        sha256 = hashlib.sha256(content).hexdigest()
+
+    return sha256, _detect_mime_type(dest_path)
+
+
 def ingest_documents(
     run_paths: RunPaths,
     input_files: list[tuple[str, bytes]],
@@ -95,7 +138,9 @@ def ingest_documents(
     Ingest input documents into a run directory.
 
     Copies files to runs/<run_id>/input/input_docs/, computes SHA256,
-    and detects MIME types. Returns DocIndexItem list with placeholder
+    and detects MIME types. Files are written and hashed on a thread pool
+    (hashing and file I/O release the GIL); results keep upload order.
+    Returns DocIndexItem list with placeholder
     values for has_text_layer and unreadable_reason (to be filled by
     pdf_text extraction).
 
@@ -111,20 +156,29 @@ def ingest_documents(
     from app.runfs import _sanitize_filename
 
     input_docs_dir = run_paths.input_docs_dir()
+    safe_names = [_sanitize_filename(filename) for filename, _ in input_files]
+
+    # Uploads sharing a sanitized name map to one file on disk; the first
+    # occurrence is the one written, so each file gets exactly one job
+    contents: dict[str, bytes] = {}
+    for safe_name, (_, content) in zip(safe_names, input_files):
+        contents.setdefault(safe_name, content)
+
+    max_workers = max(1, min(_MAX_INGEST_WORKERS, len(contents)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        file_info = dict(zip(
+            contents,
+            executor.map(
+                lambda name: _ingest_file(input_docs_dir / name, contents[name]),
+                contents,
+            ),
+        ))
+
     items: list[DocIndexItem] = []
 
-    for idx, (filename, content) in enumerate(input_files):
+    for idx, safe_name in enumerate(safe_names):
         doc_id = _format_doc_id(idx)
-        safe_name = _sanitize_filename(filename)
-
-        # Write file to input_docs directory
-        dest_path = input_docs_dir / safe_name
-        if not dest_path.exists():
-            dest_path.write_bytes(content)
-
-        # Compute sha256 and detect mime type from the written file
-        sha256 = _compute_sha256(dest_path)
-        mime_type = _detect_mime_type(dest_path)
+        sha256, mime_type = file_info[safe_name]
 
         # Create DocIndexItem with placeholders for text layer info
         item = DocIndexItem(
@@ -9,7 +9,8 @@ from __future__ import annotations
 
 import json
 import re
-from typing import Any, Literal, Protocol
+from collections import deque
+from typing import Any, Callable, Iterable, Iterator, Literal, Protocol
 
 from pydantic import ValidationError
 
@@ -272,6 +273,44 @@ def _parse_llm_response(
     return candidates
 
 
+def _with_retry(
+    call_fn: Callable[[str | None, str | None], str],
+    parse_fn: Callable[[str], list[Candidate]],
+    max_retries: int = 1,
+) -> list[Candidate]:
+    """
+    Call the LLM and parse its response, retrying on malformed output.
+
+    Args:
+        call_fn: Returns the raw LLM response. Called as
+            call_fn(previous_response, error): both None on the first attempt;
+            on a retry, the rejected response ("" if the call itself failed)
+            and the parse error message.
+        parse_fn: Parses a response; raises ValueError if it is malformed.
+        max_retries: Retries allowed after the first attempt.
+
+    Returns:
+        Candidates from the first response that parses.
+
+    Raises:
+        ValueError: The last parse error, once retries are exhausted.
+    """
+    previous_response: str | None = None
+    error: str | None = None
+    retries_left = max_retries
+
+    while True:
+        response: str | None = None
+        try:
+            response = call_fn(previous_response, error)
+            return parse_fn(response)
+        except ValueError as e:
+            if retries_left <= 0:
+                raise
+            retries_left -= 1
+            previous_response, error = response or "", str(e)
+
+
 class ApiLLMClient:
     """
     Concrete LLM client implementation for OpenAI/Anthropic.
@@ -355,21 +394,18 @@ class ApiLLMClient:
 
         messages = [{"role": "user", "content": prompt}]
 
-        # First attempt
-        try:
-            response = self._call_api(messages, run_options.max_llm_tokens)
-            return _parse_llm_response(field, response)
-        except ValueError as e:
-            first_error = str(e)
-
-        # Retry with stricter prompt
-        retry_prompt = _build_retry_prompt(field, first_error)
-        messages.append({"role": "assistant", "content": response if 'response' in dir() else ""})
-        messages.append({"role": "user", "content": retry_prompt})
+        def call(previous_response: str | None, error: str | None) -> str:
+            if error is not None:
+                # Retry with stricter prompt
+                retry_prompt = _build_retry_prompt(field, error)
+                messages.append({"role": "assistant", "content": previous_response or ""})
+                messages.append({"role": "user", "content": retry_prompt})
+            return self._call_api(messages, run_options.max_llm_tokens)
 
         try:
-            response = self._call_api(messages, run_options.max_llm_tokens)
-            return _parse_llm_response(field, response)
+            return _with_retry(
+                call, lambda response: _parse_llm_response(field, response)
+            )
         except ValueError as e:
             raise LLMInvalidJSONError(field.key, str(e))
 
@@ -383,16 +419,25 @@ class FakeLLMClient:
 
     def __init__(self) -> None:
         """Initialize with empty response queue."""
-        self._responses: list[list[Candidate] | Exception] = []
-        self._calls: list[tuple[FieldSpec, list[DocExcerpt]]] = []
+        self._responses: Iterator[list[Candidate] | Exception] = iter(())
+        self._calls: deque[tuple[FieldSpec, list[DocExcerpt]]] = deque()
 
-    def set_responses(self, responses: list[list[Candidate] | Exception]) -> None:
-        """Set the sequence of responses to return."""
-        self._responses = list(responses)
+    def set_responses(self, responses: Iterable[list[Candidate] | Exception]) -> None:
+        """
+        Set the sequence of responses to return.
+
+        Any iterable is accepted and consumed lazily, one item per call.
+        """
+        self._responses = iter(responses)
 
     def get_calls(self) -> list[tuple[FieldSpec, list[DocExcerpt]]]:
         """Get the list of calls made to this client."""
-        return self._calls
+        return list(self._calls)
+
+    def reset(self) -> None:
+        """Clear configured responses and recorded calls for reuse."""
+        self._responses = iter(())
+        self._calls.clear()
 
     def extract_candidates(
         self,
@@ -418,10 +463,10 @@ class FakeLLMClient:
         """
         self._calls.append((field, excerpts))
 
-        if not self._responses:
-            return []
+        response = next(self._responses, None)
 
-        response = self._responses.pop(0)
+        if response is None:
+            return []
 
         if isinstance(response, Exception):
             raise response
@@ -3,15 +3,23 @@ Pydantic models for the document-processor pipeline.
 
 These models define the contract for all artifacts and domain types
 used in the evidence-first form population system.
+
+Every model sets defer_build=True: its validator is compiled on first use
+rather than at import, so importing this module (or a test collecting it)
+only pays for the models actually exercised. Models also set
+hide_input_in_errors=True so ValidationError messages never echo document
+text (quoted evidence, page text) into logs; errors() still carries input.
 """
 
-from typing import Literal
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Any, Literal, Self
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
-# V1 supported field keys - the authoritative list
-SUPPORTED_FIELD_KEYS: set[str] = {
+# V1 supported field keys - the authoritative list (immutable)
+SUPPORTED_FIELD_KEYS: frozenset[str] = frozenset({
     "full_name",
     "dob",
     "phone",
@@ -19,7 +27,7 @@ SUPPORTED_FIELD_KEYS: set[str] = {
     "insurance_member_id",
     "allergies",
     "medications",
-}
+})
 
 # Field type literal
 FieldType = Literal["string", "date", "phone", "string_or_list"]
@@ -43,6 +51,8 @@ LLMProvider = Literal["anthropic", "openai"]
 class RunOptions(BaseModel):
     """Options for configuring a pipeline run."""
 
+    model_config = ConfigDict(defer_build=True, hide_input_in_errors=True)
+
     top_k_docs: int = 3
     llm_provider: LLMProvider = "anthropic"
     llm_model: str = "claude-sonnet-4-20250514"
@@ -53,6 +63,8 @@ class RunOptions(BaseModel):
 class FieldSpec(BaseModel):
     """Specification for a single field in the schema."""
 
+    model_config = ConfigDict(defer_build=True, hide_input_in_errors=True)
+
     key: str
     label: str | None = None
     type: FieldType
@@ -68,6 +80,8 @@ class FieldSpec(BaseModel):
 class ResolvedSchema(BaseModel):
     """The resolved schema for a run, including source and any unsupported fields."""
 
+    model_config = ConfigDict(defer_build=True, hide_input_in_errors=True)
+
     schema_source: SchemaSource
     resolved_fields: list[FieldSpec]
     unsupported_fields: list[str] = Field(default_factory=list)
@@ -76,6 +90,8 @@ class ResolvedSchema(BaseModel):
 class DocIndexItem(BaseModel):
     """Metadata for a single document in the index."""
 
+    model_config = ConfigDict(defer_build=True, hide_input_in_errors=True)
+
     doc_id: str
     filename: str
     mime_type: str
@@ -88,6 +104,8 @@ class DocIndexItem(BaseModel):
 class LayoutSpan(BaseModel):
     """A span of text with optional bounding box."""
 
+    model_config = ConfigDict(defer_build=True, hide_input_in_errors=True)
+
     text: str
     bbox: list[float] | None = None
 
@@ -95,6 +113,10 @@ class LayoutSpan(BaseModel):
 class LayoutPageText(BaseModel):
     """Text content for a single page."""
 
+    model_config = ConfigDict(
+        frozen=True, defer_build=True, hide_input_in_errors=True
+    )
+
     page: int
     full_text: str
     spans: list[LayoutSpan] = Field(default_factory=list)
@@ -106,10 +128,32 @@ class LayoutPageText(BaseModel):
             raise ValueError(f"Page must be >= 1, got {v}")
         return v
 
+    @cached_property
+    def full_text_lower(self) -> str:
+        """
+        Lowercased full_text, computed once per page.
+
+        Not a field: excluded from serialization and equality. The model is
+        frozen, and model_copy drops the cached value when full_text is
+        updated, so it always matches full_text.
+        """
+        return self.full_text.lower()
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy the page, dropping full_text_lower if full_text changes."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update and "full_text" in update:
+            copied.__dict__.pop("full_text_lower", None)
+        return copied
+
 
 class LayoutDoc(BaseModel):
     """Layout information for a single document."""
 
+    model_config = ConfigDict(defer_build=True, hide_input_in_errors=True)
+
     doc_id: str
     pages: list[LayoutPageText]
 
@@ -117,6 +161,8 @@ class LayoutDoc(BaseModel):
 class RoutingEntry(BaseModel):
     """Routing decision for a single field."""
 
+    model_config = ConfigDict(defer_build=True, hide_input_in_errors=True)
+
     field: str
     doc_ids: list[str]
     scores: dict[str, float]
@@ -132,6 +178,10 @@ class RoutingEntry(BaseModel):
 class Evidence(BaseModel):
     """Evidence supporting a candidate value."""
 
+    model_config = ConfigDict(
+        frozen=True, defer_build=True, hide_input_in_errors=True
+    )
+
     doc_id: str
     page: int
     quoted_text: str
@@ -169,6 +219,10 @@ def _validate_score_range(v: float, field_name: str) -> float:
 class CandidateScores(BaseModel):
     """Scores for a candidate extraction."""
 
+    model_config = ConfigDict(
+        frozen=True, defer_build=True, hide_input_in_errors=True
+    )
+
     anchor_match: float
     validator: float
     doc_relevance: float
@@ -204,6 +258,8 @@ class CandidateScores(BaseModel):
 class Candidate(BaseModel):
     """A candidate value for a field."""
 
+    model_config = ConfigDict(defer_build=True, hide_input_in_errors=True)
+
     field: str
     raw_value: str
     normalized_value: str
@@ -236,6 +292,8 @@ class Candidate(BaseModel):
 class FinalField(BaseModel):
     """The final resolved value for a field."""
 
+    model_config = ConfigDict(defer_build=True, hide_input_in_errors=True)
+
     field: str
     status: FieldStatus
     value: str | None = None
@@ -254,6 +312,8 @@ class FinalField(BaseModel):
 class FinalResult(BaseModel):
     """The final result of a pipeline run."""
 
+    model_config = ConfigDict(defer_build=True, hide_input_in_errors=True)
+
     run_id: str
     schema_source: SchemaSource
     fields: dict[str, FinalField]
@@ -9,11 +9,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
+from typing import BinaryIO
 
 from pypdf import PdfReader
 from pypdf.errors import PdfReadError
 
 
+# PDF magic bytes
+_PDF_MAGIC = b"%PDF"
+
+
 @dataclass
 class PdfExtractionResult:
     """Result of PDF text extraction."""
@@ -24,7 +29,7 @@ class PdfExtractionResult:
     error: str | None = None
 
 
-def extract_text_per_page(filepath: Path) -> PdfExtractionResult:
+def extract_text_per_page(filepath: Path | BinaryIO) -> PdfExtractionResult:
     """
     Extract text from each page of a PDF.
 
@@ -32,7 +37,8 @@ def extract_text_per_page(filepath: Path) -> PdfExtractionResult:
     If all pages yield empty/whitespace-only text, has_text_layer is False.
 
     Args:
-        filepath: Path to the PDF file.
+        filepath: Path to the PDF file, or a seekable binary stream over
+            its bytes (e.g. io.BytesIO) to parse without touching disk.
 
     Returns:
         PdfExtractionResult with per-page text (0-indexed), page count,
@@ -84,6 +90,19 @@ def extract_text_per_page(filepath: Path) -> PdfExtractionResult:
     )
 
 
+def is_pdf_bytes(data: bytes) -> bool:
+    """
+    Check if file content is a PDF by its header.
+
+    Args:
+        data: File content, or at least its first few bytes.
+
+    Returns:
+        True if the data starts with PDF magic bytes, False otherwise.
+    """
+    return data.startswith(_PDF_MAGIC)
+
+
 def is_pdf(filepath: Path) -> bool:
     """
     Check if a file is a PDF by reading its header.
@@ -97,7 +116,6 @@ def is_pdf(filepath: Path) -> bool:
     try:
         with open(filepath, "rb") as f:
             header = f.read(8)
-        return header.startswith(b"%PDF")
+        return is_pdf_bytes(header)
     except OSError:
         return False
-
@@ -17,14 +17,33 @@ All runs are stored under a configurable base directory with the following struc
 from __future__ import annotations
 
 import json
+import math
 import os
 import re
 import secrets
+import shutil
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+# orjson options matching json.dumps(ensure_ascii=False, sort_keys=True,
+# indent=2). Types stdlib json rejects are passed through so they fail over
+# to json and raise the same TypeError.
+_ORJSON_ARTIFACT_OPTIONS = (
+    orjson.OPT_INDENT_2
+    | orjson.OPT_SORT_KEYS
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+    if orjson is not None else 0
+)
 
 # Default base directory for runs (relative to backend root or cwd)
 DEFAULT_RUNS_DIR = Path("runs")
@@ -77,9 +96,9 @@ def _sanitize_filename(filename: str) -> str:
     Raises:
         ValueError: If the filename is empty or invalid after sanitization.
     """
-    # Strip directory components
-    name = filename.replace("\\", "/")
-    name = name.split("/")[-1]
+    # Strip directory components (rpartition keeps only the last one
+    # instead of building a list of every path segment)
+    name = filename.replace("\\", "/").rpartition("/")[2]
 
     # Strip leading/trailing whitespace and dots that could be problematic
     name = name.strip()
@@ -88,11 +107,9 @@ def _sanitize_filename(filename: str) -> str:
     if not name or name in (".", ".."):
         raise ValueError(f"Invalid filename: {filename!r}")
 
-    # Remove any path traversal attempts that might remain
-    if ".." in name:
-        name = name.replace("..", "_")
-
-    return name
+    # Remove any path traversal attempts that might remain (str.replace
+    # returns the name itself when there is nothing to replace)
+    return name.replace("..", "_")
 
 
 @dataclass
@@ -187,7 +204,87 @@ def create_run(
     )
 
 
-def write_json_atomic(path: Path, data: Any) -> None:
+def _has_non_finite_float(data: Any) -> bool:
+    """
+    Check whether a JSON-like structure holds a NaN or infinite float.
+
+    Args:
+        data: The data to scan (dicts, lists, tuples and scalars).
+
+    Returns:
+        True if any float value is NaN, inf or -inf.
+    """
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def _dumps_artifact(data: Any) -> bytes:
+    """
+    Serialize data with the artifact formatting, as UTF-8 bytes.
+
+    Uses orjson when installed and falls back to json for anything orjson
+    cannot encode (e.g. non-str keys, integers beyond 64 bits) or encodes
+    differently: orjson writes NaN and Infinity as null, so data holding
+    non-finite floats goes through json, which writes NaN/Infinity.
+
+    Artifacts are plain JSON data (dicts, lists, tuples, str, int, float,
+    bool, None), as produced by model_dump. For those, output is identical
+    apart from float exponent spelling (1e-07 vs 1e-7). Other types are not
+    guaranteed to match: orjson encodes some natively (e.g. uuid.UUID,
+    enum members) where json raises TypeError.
+    """
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(data, option=_ORJSON_ARTIFACT_OPTIONS)
+        except TypeError:
+            pass
+        else:
+            # A non-finite float can only have become a null, so the scan is
+            # needed only when the output contains one
+            if b"null" not in payload or not _has_non_finite_float(data):
+                return payload
+
+    return json.dumps(
+        data,
+        ensure_ascii=False,
+        sort_keys=True,
+        indent=2,
+    ).encode("utf-8")
+
+
+def _fsync_dir(directory: Path) -> None:
+    """
+    Flush a directory's entries (e.g. a completed rename) to disk.
+
+    Best effort: platforms that cannot open directories (Windows) and
+    filesystems that reject fsync on them are skipped silently.
+
+    Args:
+        directory: The directory to flush.
+    """
+    try:
+        fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return
+
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_json_atomic(path: Path, data: Any, *, durable: bool = True) -> None:
     """
     Write JSON data to a file atomically.
 
@@ -199,9 +296,14 @@ def write_json_atomic(path: Path, data: Any) -> None:
     - sort_keys=True (stable ordering)
     - indent=2 (human readable)
 
+    Serialized with orjson when available (see _dumps_artifact).
+
     Args:
         path: The target file path.
         data: The data to serialize as JSON.
+        durable: If True (default), fsync the temp file before the rename
+            and the parent directory after it, so the new file survives a
+            crash. Pass False for scratch output where atomicity is enough.
 
     Raises:
         OSError: If file operations fail.
@@ -214,28 +316,29 @@ def write_json_atomic(path: Path, data: Any) -> None:
     tmp_path = path.with_suffix(path.suffix + ".tmp")
 
     # Serialize with stable formatting
-    json_str = json.dumps(
-        data,
-        ensure_ascii=False,
-        sort_keys=True,
-        indent=2,
-    )
+    payload = _dumps_artifact(data)
 
-    # Write to temp file with fsync
-    with open(tmp_path, "w", encoding="utf-8") as f:
-        f.write(json_str)
-        f.flush()
-        os.fsync(f.fileno())
+    # Write to temp file, fsynced so the rename never exposes an empty file
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
 
     # Atomic rename to final path (works on POSIX and Windows via os.replace)
     tmp_path.replace(path)
 
+    # Persist the rename itself
+    if durable:
+        _fsync_dir(path.parent)
+
 
 def read_json(path: Path) -> Any:
     """
     Read and parse a JSON file.
 
-    Convenience function for tests and internal use.
+    Convenience function for tests and internal use. Parsed with orjson
+    when available, falling back to json.
 
     Args:
         path: Path to the JSON file.
@@ -247,16 +350,70 @@ def read_json(path: Path) -> Any:
         FileNotFoundError: If the file doesn't exist.
         json.JSONDecodeError: If the file contains invalid JSON.
     """
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    # orjson parses the bytes directly. Anything it rejects (invalid JSON,
+    # NaN literals, integers beyond 64 bits) is re-parsed by json, so
+    # results and errors match the stdlib.
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(raw.decode("utf-8"))
+
+
+# Create-only flags for input copies; O_BINARY matters on Windows only
+_CREATE_NEW_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def _copy_once(path: Path, content: bytes | Path) -> None:
+    """
+    Write content to path unless the file already exists.
+
+    O_EXCL folds the existence check into the create, so each copy costs
+    one open instead of a stat followed by an open. A source Path is
+    opened before the destination is created and streamed across in
+    chunks, so large uploads are never held in memory whole. If the copy
+    fails, the destination is removed so a retry copies it again.
+
+    Args:
+        path: The destination file path.
+        content: The bytes to write, or the path of a file to copy.
+
+    Raises:
+        OSError: If the source cannot be read or the write fails.
+    """
+    source = open(content, "rb") if isinstance(content, Path) else None
+    try:
+        try:
+            fd = os.open(path, _CREATE_NEW_FLAGS, 0o644)
+        except FileExistsError:
+            return
+
+        try:
+            with os.fdopen(fd, "wb") as dest:
+                if source is not None:
+                    shutil.copyfileobj(source, dest)
+                else:
+                    dest.write(content)
+        except BaseException:
+            # Never leave a partial file that later calls would skip
+            path.unlink(missing_ok=True)
+            raise
+    finally:
+        if source is not None:
+            source.close()
 
 
 def copy_inputs_once(
     run: RunPaths,
     *,
     request_json: dict[str, Any],
-    target_files: list[tuple[str, bytes]] | None = None,
-    input_files: list[tuple[str, bytes]],
+    target_files: list[tuple[str, bytes | Path]] | None = None,
+    input_files: list[tuple[str, bytes | Path]],
 ) -> None:
     """
     Copy input files to the run directory, idempotently.
@@ -269,6 +426,8 @@ def copy_inputs_once(
         request_json: The request data to write as request.json.
         target_files: Optional list of (filename, content) tuples for target_docs.
         input_files: Required list of (filename, content) tuples for input_docs.
+            In both lists, content is either the file bytes or the Path of a
+            file on disk to copy (avoids loading large uploads into memory).
 
     Note:
         Filenames are sanitized to prevent path traversal attacks.
@@ -284,14 +443,10 @@ def copy_inputs_once(
         target_dir = run.target_docs_dir()
         for filename, content in target_files:
             safe_name = _sanitize_filename(filename)
-            dest = target_dir / safe_name
-            if not dest.exists():
-                dest.write_bytes(content)
+            _copy_once(target_dir / safe_name, content)
 
     # Copy input_docs files
     input_dir = run.input_docs_dir()
     for filename, content in input_files:
         safe_name = _sanitize_filename(filename)
-        dest = input_dir / safe_name
-        if not dest.exists():
-            dest.write_bytes(content)
+        _copy_once(input_dir / safe_name, content)
@@ -12,9 +12,17 @@ Produces artifacts/schema.json containing ResolvedSchema.
 from __future__ import annotations
 
 import json
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+try:
+    from pypdf import PdfReader
+except ImportError:  # pragma: no cover - pypdf is a declared dependency
+    PdfReader = None  # type: ignore[assignment,misc]
+
 from app.models import (
     FieldSpec,
     FieldType,
@@ -41,6 +49,9 @@ FIELD_ORDER: list[str] = [
     "medications",
 ]
 
+# Position of each key in FIELD_ORDER, used as a sort key
+_FIELD_ORDER_INDEX: dict[str, int] = {key: i for i, key in enumerate(FIELD_ORDER)}
+
 # Default field types for V1 supported fields
 FIELD_TYPES: dict[str, FieldType] = {
     "full_name": "string",
@@ -52,6 +63,10 @@ FIELD_TYPES: dict[str, FieldType] = {
     "medications": "string_or_list",
 }
 
+# Upper bound on user schema payload size; larger payloads are rejected
+# before decoding so attacker-supplied schemas cannot force a huge parse
+MAX_USER_SCHEMA_BYTES: int = 1024 * 1024
+
 # Alias map for AcroForm field matching (fixed)
 # Each key maps to a list of substrings that indicate that field
 FIELD_ALIASES: dict[str, list[str]] = {
@@ -65,19 +80,19 @@ FIELD_ALIASES: dict[str, list[str]] = {
 }
 
 
+@dataclass(slots=True)
 class SchemaWarning:
     """Represents a warning during schema resolution."""
 
-    def __init__(self, kind: str, message: str, details: dict[str, Any] | None = None):
-        self.kind = kind
-        self.message = message
-        self.details = details or {}
+    kind: str
+    message: str
+    details: dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        result: dict[str, Any] = {"kind": self.kind, "message": self.message}
+        """Trace-event fields for this warning; details only when non-empty."""
         if self.details:
-            result["details"] = self.details
-        return result
+            return {"kind": self.kind, "message": self.message, "details": self.details}
+        return {"kind": self.kind, "message": self.message}
 
 
 def _order_and_cap_fields(
@@ -94,14 +109,11 @@ def _order_and_cap_fields(
     Returns:
         Ordered and capped list of FieldSpec.
     """
-    # Create a map for O(1) lookup
-    field_map = {f.key: f for f in fields}
+    # Deduplicate by key (last wins), dropping keys not in FIELD_ORDER
+    field_map = {f.key: f for f in fields if f.key in _FIELD_ORDER_INDEX}
 
-    # Order by FIELD_ORDER, keeping only fields that exist
-    ordered = []
-    for key in FIELD_ORDER:
-        if key in field_map:
-            ordered.append(field_map[key])
+    # Order by FIELD_ORDER position
+    ordered = sorted(field_map.values(), key=lambda f: _FIELD_ORDER_INDEX[f.key])
 
     # Cap to max_fields
     return ordered[:max_fields]
@@ -149,6 +161,16 @@ def parse_user_schema(
     Returns:
         ResolvedSchema if parsing succeeds, None if invalid.
     """
+    if len(schema_json_bytes) > MAX_USER_SCHEMA_BYTES:
+        warnings.append(SchemaWarning(
+            kind="user_schema_invalid",
+            message=(
+                f"Schema JSON is {len(schema_json_bytes)} bytes, "
+                f"exceeds limit of {MAX_USER_SCHEMA_BYTES}"
+            ),
+        ))
+        return None
+
     try:
         data = json.loads(schema_json_bytes.decode("utf-8"))
     except (json.JSONDecodeError, UnicodeDecodeError) as e:
@@ -174,7 +196,9 @@ def parse_user_schema(
         ))
         return None
 
-    resolved_fields: list[FieldSpec] = []
+    # Label per supported key (last occurrence wins); FieldSpecs are built
+    # once per key after the scan, so their count is bounded by the key set
+    labels_by_key: dict[str, str | None] = {}
     unsupported_fields: list[str] = []
 
     for item in fields_data:
@@ -185,6 +209,10 @@ def parse_user_schema(
         if not isinstance(key, str):
             continue
 
+        # Intern so the membership check below (and later dict lookups)
+        # can match the interned literal keys by identity
+        key = sys.intern(key)
+
         # Check if key is supported
         if key not in SUPPORTED_FIELD_KEYS:
             unsupported_fields.append(key)
@@ -195,10 +223,13 @@ def parse_user_schema(
         if label is not None and not isinstance(label, str):
             label = None
 
-        field_type = item.get("type")
-        # Use the correct type for the key (from FIELD_TYPES), not user-provided type
-        # This ensures type consistency
-        resolved_fields.append(_make_field_spec(key, label))
+        # The type comes from FIELD_TYPES, not the user-provided type,
+        # to ensure type consistency
+        labels_by_key[key] = label
+
+    resolved_fields = [
+        _make_field_spec(key, label) for key, label in labels_by_key.items()
+    ]
 
     # Order and cap fields
     resolved_fields = _order_and_cap_fields(resolved_fields, options.max_fields)
@@ -264,9 +295,7 @@ def _extract_acroform_fields(pdf_path: Path) -> list[str] | None:
     Returns:
         List of field names if the PDF has AcroForm fields, None otherwise.
     """
-    try:
-        from pypdf import PdfReader
-    except ImportError:
+    if PdfReader is None:
         # pypdf not available
         return None
 
@@ -378,6 +407,29 @@ def _resolve_fallback_v1(options: RunOptions) -> ResolvedSchema:
     )
 
 
+def _schema_to_dict(resolved: ResolvedSchema) -> dict[str, Any]:
+    """
+    Build the schema.json payload for a ResolvedSchema.
+
+    Equivalent to resolved.model_dump() for this fixed, flat shape, without
+    going through pydantic's generic serializer.
+
+    Args:
+        resolved: The resolved schema to serialize.
+
+    Returns:
+        JSON-compatible dict.
+    """
+    return {
+        "schema_source": resolved.schema_source,
+        "resolved_fields": [
+            {"key": f.key, "label": f.label, "type": f.type}
+            for f in resolved.resolved_fields
+        ],
+        "unsupported_fields": list(resolved.unsupported_fields),
+    }
+
+
 def resolve_schema(
     run_paths: RunPaths,
     schema_json_bytes: bytes | None,
@@ -429,24 +481,26 @@ def resolve_schema(
         if resolved is None:
             resolved = _resolve_fallback_v1(options)
 
-        # Log warnings to trace
-        for warning in warnings:
-            trace.append({
-                "ts": _utc_iso_timestamp(),
+        # Log warnings to trace in a single batched write
+        ts = _utc_iso_timestamp()
+        trace.extend([
+            {
+                "ts": ts,
                 "run_id": trace.run_id,
                 "step": "resolve_schema",
                 "level": "warn",
                 **warning.to_dict(),
-            })
+            }
+            for warning in warnings
+        ])
 
         # Write artifact
         schema_path = run_paths.artifact_path("schema.json")
-        write_json_atomic(schema_path, resolved.model_dump())
+        write_json_atomic(schema_path, _schema_to_dict(resolved))
 
     return resolved
 
 
 def _utc_iso_timestamp() -> str:
     """Get current UTC timestamp in ISO-8601 format."""
-    from datetime import datetime, timezone
     return datetime.now(timezone.utc).isoformat(timespec="microseconds").replace("+00:00", "Z")
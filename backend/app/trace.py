@@ -68,6 +68,31 @@ class TraceLogger:
             f.write(json_line)
             f.write("\n")
 
+    def extend(self, events: list[dict[str, Any]]) -> None:
+        """
+        Append several trace events to the log file in one write.
+
+        Produces the same lines as calling append() for each event, but
+        opens the file once and issues a single write for the batch.
+
+        Args:
+            events: The event dictionaries to log, in order.
+        """
+        if not events:
+            return
+
+        # Ensure parent directory exists
+        self._trace_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Serialize each event as single-line JSON, newline-terminated
+        payload = "".join(
+            json.dumps(event, ensure_ascii=False, sort_keys=True) + "\n"
+            for event in events
+        )
+
+        with open(self._trace_path, "a", encoding="utf-8") as f:
+            f.write(payload)
+
 
 def _utc_iso_timestamp() -> str:
     """
@@ -0,0 +1,127 @@
+"""
+Shared pytest fixtures.
+
+Exposes the PDF fixture bytes, read from disk once per session, and a
+session cache of pypdf extraction results keyed by file content hash.
+"""
+
+import dataclasses
+import hashlib
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+# conftest is imported before any test module, so each process (and each
+# xdist worker) loads app.models once here, through app.layout_builder;
+# test-module imports then hit sys.modules. Model schemas are compiled
+# lazily (defer_build), so a worker only pays for the models its tests touch.
+import app.layout_builder
+from app.pdf_text import PdfExtractionResult, extract_text_per_page
+
+
+# Directory holding the sample PDF fixtures
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+# --- xdist ---
+
+
+@pytest.fixture(scope="session")
+def xdist_worker() -> str:
+    """
+    pytest-xdist worker name ("gw0", "gw1", ...), or "master" when serial.
+
+    Read from PYTEST_XDIST_WORKER so it resolves without the xdist plugin.
+    Named apart from xdist's own worker_id fixture so the two never clash.
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+# --- Disk flushes ---
+
+
+@pytest.fixture
+def no_fsync(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Turn os.fsync into a no-op for the test.
+
+    write_json_atomic flushes every artifact to disk. That durability is
+    useless for throwaway tmp_path runs and is the main disk cost of the
+    pipeline integration tests. Atomicity (temp file + os.replace) is kept.
+    """
+    monkeypatch.setattr(os, "fsync", lambda fd: None)
+
+
+# --- PDF fixture bytes ---
+
+
+@pytest.fixture(scope="session")
+def sample_text_bytes() -> bytes:
+    """Bytes of fixtures/sample_text.pdf (one page, "Hello World")."""
+    return (FIXTURES_DIR / "sample_text.pdf").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def blank_bytes() -> bytes:
+    """Bytes of fixtures/blank.pdf (one page, no text layer)."""
+    return (FIXTURES_DIR / "blank.pdf").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def two_pages_bytes() -> bytes:
+    """Bytes of fixtures/two_pages.pdf ("Page One" / "Page Two")."""
+    return (FIXTURES_DIR / "two_pages.pdf").read_bytes()
+
+
+# --- PDF extraction cache ---
+
+
+@pytest.fixture(scope="session")
+def extract_cache() -> dict[str, PdfExtractionResult]:
+    """Session-wide map of PDF sha256 -> PdfExtractionResult."""
+    return {}
+
+
+def cached_extract(
+    path: Path, cache: dict[str, PdfExtractionResult]
+) -> PdfExtractionResult:
+    """
+    extract_text_per_page, memoized on the file's content hash.
+
+    Keying on bytes rather than path means copies of the same fixture under
+    different run directories share one parse. Each call returns a fresh
+    result with its own pages list so callers cannot corrupt the cache.
+
+    Args:
+        path: Path to the PDF file.
+        cache: Cache from the extract_cache fixture.
+
+    Returns:
+        PdfExtractionResult equal to extract_text_per_page(path).
+    """
+    key = hashlib.sha256(path.read_bytes()).hexdigest()
+    result = cache.get(key)
+    if result is None:
+        result = cache[key] = extract_text_per_page(path)
+    return dataclasses.replace(result, pages=list(result.pages))
+
+
+@pytest.fixture
+def cached_extraction(
+    extract_cache: dict[str, PdfExtractionResult],
+    monkeypatch: pytest.MonkeyPatch,
+) -> Callable[[Path], PdfExtractionResult]:
+    """
+    Route the pipeline's PDF text extraction through the session cache.
+
+    Patches app.layout_builder.extract_text_per_page for the duration of
+    the test and returns the cached extractor for direct use.
+    """
+
+    def extract(path: Path) -> PdfExtractionResult:
+        return cached_extract(path, extract_cache)
+
+    monkeypatch.setattr(app.layout_builder, "extract_text_per_page", extract)
+    return extract
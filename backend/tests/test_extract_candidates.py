@@ -5,9 +5,15 @@ Tests the orchestration logic, evidence checking, and artifact writing
 without network calls. Uses temp directories and fake LLM client.
 """
 
+import functools
+import itertools
+import os
+import shutil
 from pathlib import Path
+from typing import Iterator
 
 import pytest
+from pydantic import TypeAdapter
 
 from app.extract_candidates import (
     _compute_provisional_confidence,
@@ -18,6 +24,7 @@ from app.llm_client import FakeLLMClient, LLMInvalidJSONError
 from app.models import (
     Candidate,
     CandidateScores,
+    DocIndexItem,
     Evidence,
     FieldSpec,
     LayoutDoc,
@@ -29,25 +36,41 @@ from app.models import (
 from app.runfs import create_run, read_json, write_json_atomic
 
 
+# Artifact list serializers, built once (TypeAdapter construction is costly)
+_LAYOUT_ADAPTER = TypeAdapter(list[LayoutDoc])
+_ROUTING_ADAPTER = TypeAdapter(list[RoutingEntry])
+_DOC_INDEX_ADAPTER = TypeAdapter(list[DocIndexItem])
+
+# Run ID of the canonical run tree produced by the run_tree fixture
+BASE_RUN_ID = "base-run"
+
+# Oversized single-page document body used by the excerpt capping test
+_LARGE_TEXT = "Name: Test\n" + ("x" * 10000)
+
+
 # --- Helper factories ---
 
 
+_TYPE_MAP = {
+    "full_name": "string",
+    "dob": "date",
+    "phone": "phone",
+    "address": "string",
+    "insurance_member_id": "string",
+    "allergies": "string_or_list",
+    "medications": "string_or_list",
+}
+
+
+@functools.lru_cache(maxsize=None)
 def make_field_spec(key: str, label: str | None = None) -> FieldSpec:
-    """Create a minimal FieldSpec."""
-    type_map = {
-        "full_name": "string",
-        "dob": "date",
-        "phone": "phone",
-        "address": "string",
-        "insurance_member_id": "string",
-        "allergies": "string_or_list",
-        "medications": "string_or_list",
-    }
-    return FieldSpec(key=key, label=label, type=type_map[key])
-
-
-def make_layout_doc(doc_id: str, pages_text: list[str]) -> LayoutDoc:
-    """Create a minimal LayoutDoc with pages."""
+    """Create a minimal FieldSpec (shared instance; treat as read-only)."""
+    return FieldSpec(key=key, label=label, type=_TYPE_MAP[key])
+
+
+@functools.lru_cache(maxsize=None)
+def make_layout_doc(doc_id: str, pages_text: tuple[str, ...]) -> LayoutDoc:
+    """Create a minimal LayoutDoc with pages (shared instance; treat as read-only)."""
     pages = [
         LayoutPageText(page=i + 1, full_text=text)
         for i, text in enumerate(pages_text)
@@ -82,6 +105,18 @@ def make_candidate(
     )
 
 
+def _fast_write_json(path: Path, data: bytes) -> None:
+    """
+    Write pre-encoded JSON bytes for a test artifact.
+
+    Skips write_json_atomic's fsync + rename: test runs live under tmp_path
+    and are discarded afterwards, so they do not need crash durability.
+    Production code must keep write_json_atomic.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
 def setup_run_artifacts(
     tmp_path: Path,
     run_id: str,
@@ -93,192 +128,200 @@ def setup_run_artifacts(
     run = create_run(run_id=run_id, base_dir=tmp_path)
 
     # Write schema
-    write_json_atomic(
+    _fast_write_json(
         run.artifact_path("schema.json"),
-        schema.model_dump(),
+        schema.model_dump_json().encode("utf-8"),
     )
 
     # Write layout
-    write_json_atomic(
+    _fast_write_json(
         run.artifact_path("layout.json"),
-        [doc.model_dump() for doc in layout],
+        _LAYOUT_ADAPTER.dump_json(layout),
     )
 
     # Write routing
-    write_json_atomic(
+    _fast_write_json(
         run.artifact_path("routing.json"),
-        [entry.model_dump() for entry in routing],
+        _ROUTING_ADAPTER.dump_json(routing),
     )
 
     # Write doc_index (minimal)
-    write_json_atomic(
+    doc_index = [
+        DocIndexItem(
+            doc_id=doc.doc_id,
+            filename=f"{doc.doc_id}.pdf",
+            mime_type="application/pdf",
+            pages=len(doc.pages),
+            has_text_layer=True,
+            sha256=f"sha_{doc.doc_id}",
+        )
+        for doc in layout
+    ]
+    _fast_write_json(
         run.artifact_path("doc_index.json"),
-        [{"doc_id": doc.doc_id, "filename": f"{doc.doc_id}.pdf",
-          "mime_type": "application/pdf", "pages": len(doc.pages),
-          "has_text_layer": True, "sha256": f"sha_{doc.doc_id}"}
-         for doc in layout],
+        _DOC_INDEX_ADAPTER.dump_json(doc_index),
     )
 
 
-# --- Test evidence_supports_value ---
+def _empty_responses(n: int) -> Iterator[list[Candidate]]:
+    """Lazily yield n empty LLM responses."""
+    return itertools.repeat([], n)
 
 
-class TestEvidenceSupportsValue:
-    """Tests for the deterministic hallucination check."""
+# --- Shared fixtures ---
 
-    def test_string_field_substring_match(self) -> None:
-        """String field: normalized_value substring in normalized evidence."""
-        field = make_field_spec("full_name")
-        candidate = make_candidate(
-            field="full_name",
-            raw_value="John Doe",
-            normalized_value="john doe",
-            doc_id="doc_001",
-            page=1,
-            quoted_text="Patient Name: John Doe, MD",
-        )
 
-        assert evidence_supports_value(field, candidate) is True
+def _link_or_copy(src: str, dst: str) -> str:
+    """Hardlink src to dst, falling back to a copy if linking fails."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
 
-    def test_string_field_no_match(self) -> None:
-        """String field: normalized_value not in evidence."""
-        field = make_field_spec("full_name")
-        candidate = make_candidate(
-            field="full_name",
-            raw_value="John Doe",
-            normalized_value="john doe",
-            doc_id="doc_001",
-            page=1,
-            quoted_text="Patient Name: Jane Smith",  # Different name
-        )
 
-        assert evidence_supports_value(field, candidate) is False
+@pytest.fixture(scope="module")
+def _base_run_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Build the canonical run artifacts once per module.
 
-    def test_date_field_matches_yyyy_mm_dd(self) -> None:
-        """Date field: normalized date matches YYYY-MM-DD in evidence."""
-        field = make_field_spec("dob")
-        candidate = make_candidate(
-            field="dob",
-            raw_value="01/15/1990",
-            normalized_value="1990-01-15",
-            doc_id="doc_001",
-            page=1,
-            quoted_text="DOB: 1990-01-15",
-        )
+    Configuration: schema with a single full_name field, one document
+    (doc_001, "Patient Name: John Doe"), and routing of full_name to doc_001.
 
-        assert evidence_supports_value(field, candidate) is True
+    Returns:
+        Base directory containing runs/<BASE_RUN_ID>/.
+    """
+    base_dir = tmp_path_factory.mktemp("base_runs")
+    setup_run_artifacts(
+        base_dir,
+        BASE_RUN_ID,
+        ResolvedSchema(
+            schema_source="fallback_v1",
+            resolved_fields=[make_field_spec("full_name")],
+        ),
+        [make_layout_doc("doc_001", ("Patient Name: John Doe",))],
+        [RoutingEntry(field="full_name", doc_ids=["doc_001"], scores={"doc_001": 0.8})],
+    )
+    return base_dir
 
-    def test_date_field_matches_mm_dd_yyyy(self) -> None:
-        """Date field: normalized date matches MM/DD/YYYY in evidence."""
-        field = make_field_spec("dob")
-        candidate = make_candidate(
-            field="dob",
-            raw_value="1990-01-15",
-            normalized_value="1990-01-15",
-            doc_id="doc_001",
-            page=1,
-            quoted_text="DOB: 01/15/1990",
-        )
 
-        assert evidence_supports_value(field, candidate) is True
+@pytest.fixture
+def run_tree(_base_run_tree: Path, tmp_path: Path) -> Path:
+    """
+    Per-test copy of the canonical run tree.
 
-    def test_date_field_matches_month_name(self) -> None:
-        """Date field: normalized date matches month name format."""
-        field = make_field_spec("dob")
-        candidate = make_candidate(
-            field="dob",
-            raw_value="January 15, 1990",
-            normalized_value="1990-01-15",
-            doc_id="doc_001",
-            page=1,
-            quoted_text="Born: January 15, 1990",
-        )
+    Artifact files are hardlinked (copied if linking is unsupported). This is
+    safe because the pipeline replaces artifacts atomically rather than
+    writing into existing files.
 
-        assert evidence_supports_value(field, candidate) is True
+    Returns:
+        Base directory to pass as base_dir; the run ID is BASE_RUN_ID.
+    """
+    shutil.copytree(
+        _base_run_tree / BASE_RUN_ID,
+        tmp_path / BASE_RUN_ID,
+        copy_function=_link_or_copy,
+    )
+    return tmp_path
 
-    def test_date_field_no_match(self) -> None:
-        """Date field: normalized date not in evidence."""
-        field = make_field_spec("dob")
-        candidate = make_candidate(
-            field="dob",
-            raw_value="1990-01-15",
-            normalized_value="1990-01-15",
-            doc_id="doc_001",
-            page=1,
-            quoted_text="DOB: 1985-05-20",  # Different date
-        )
 
-        assert evidence_supports_value(field, candidate) is False
+@pytest.fixture(scope="module")
+def _shared_fake_llm() -> FakeLLMClient:
+    """One FakeLLMClient reused by every test in this module."""
+    return FakeLLMClient()
 
-    def test_phone_field_digits_match(self) -> None:
-        """Phone field: normalized digits match evidence digits."""
-        field = make_field_spec("phone")
-        candidate = make_candidate(
-            field="phone",
-            raw_value="(555) 123-4567",
-            normalized_value="15551234567",
-            doc_id="doc_001",
-            page=1,
-            quoted_text="Phone: 555-123-4567",
-        )
 
-        assert evidence_supports_value(field, candidate) is True
+@pytest.fixture
+def fake_llm(_shared_fake_llm: FakeLLMClient) -> FakeLLMClient:
+    """The shared FakeLLMClient, reset so no state leaks between tests."""
+    _shared_fake_llm.reset()
+    return _shared_fake_llm
 
-    def test_phone_field_with_country_code_matches(self) -> None:
-        """Phone field: digits with country code match base digits."""
-        field = make_field_spec("phone")
-        candidate = make_candidate(
-            field="phone",
-            raw_value="555-123-4567",
-            normalized_value="15551234567",  # +1 added
-            doc_id="doc_001",
-            page=1,
-            quoted_text="Tel: 5551234567",  # Without country code
-        )
 
-        assert evidence_supports_value(field, candidate) is True
+@pytest.fixture(scope="session")
+def default_run_options() -> RunOptions:
+    """Default RunOptions (read-only; build a new one to override values)."""
+    return RunOptions()
 
-    def test_phone_field_no_match(self) -> None:
-        """Phone field: digits don't match."""
-        field = make_field_spec("phone")
-        candidate = make_candidate(
-            field="phone",
-            raw_value="555-123-4567",
-            normalized_value="15551234567",
-            doc_id="doc_001",
-            page=1,
-            quoted_text="Phone: 555-999-8888",  # Different number
-        )
 
-        assert evidence_supports_value(field, candidate) is False
+# --- Test evidence_supports_value ---
 
-    def test_list_field_all_items_present(self) -> None:
-        """List field: all items present in evidence."""
-        field = make_field_spec("allergies")
-        candidate = make_candidate(
-            field="allergies",
-            raw_value="Penicillin, Sulfa",
-            normalized_value="penicillin sulfa",
-            doc_id="doc_001",
-            page=1,
-            quoted_text="Allergies: Penicillin, Sulfa, Latex",
-        )
 
-        assert evidence_supports_value(field, candidate) is True
+class TestEvidenceSupportsValue:
+    """Tests for the deterministic hallucination check."""
 
-    def test_list_field_item_missing(self) -> None:
-        """List field: one item not in evidence."""
-        field = make_field_spec("allergies")
+    @pytest.mark.parametrize(
+        "field_key,normalized_value,quoted_text,expected",
+        [
+            # String field: normalized_value substring in normalized evidence
+            pytest.param(
+                "full_name", "john doe", "Patient Name: John Doe, MD", True,
+                id="string_substring_match",
+            ),
+            pytest.param(
+                "full_name", "john doe", "Patient Name: Jane Smith", False,
+                id="string_no_match",
+            ),
+            # Date field: normalized date matches date-like substring in evidence
+            pytest.param(
+                "dob", "1990-01-15", "DOB: 1990-01-15", True,
+                id="date_matches_yyyy_mm_dd",
+            ),
+            pytest.param(
+                "dob", "1990-01-15", "DOB: 01/15/1990", True,
+                id="date_matches_mm_dd_yyyy",
+            ),
+            pytest.param(
+                "dob", "1990-01-15", "Born: January 15, 1990", True,
+                id="date_matches_month_name",
+            ),
+            pytest.param(
+                "dob", "1990-01-15", "DOB: 1985-05-20", False,
+                id="date_no_match",
+            ),
+            # Phone field: normalized digits match evidence digits
+            pytest.param(
+                "phone", "15551234567", "Phone: 555-123-4567", True,
+                id="phone_digits_match",
+            ),
+            pytest.param(
+                "phone", "15551234567", "Tel: 5551234567", True,
+                id="phone_country_code_added",
+            ),
+            pytest.param(
+                "phone", "15551234567", "Phone: 555-999-8888", False,
+                id="phone_no_match",
+            ),
+            # List field: every item must appear in evidence
+            pytest.param(
+                "allergies", "penicillin sulfa", "Allergies: Penicillin, Sulfa, Latex", True,
+                id="list_all_items_present",
+            ),
+            pytest.param(
+                "allergies", "penicillin, peanuts", "Allergies: Penicillin, Sulfa", False,
+                id="list_item_missing",
+            ),
+        ],
+    )
+    def test_evidence_support(
+        self,
+        field_key: str,
+        normalized_value: str,
+        quoted_text: str,
+        expected: bool,
+    ) -> None:
+        """evidence_supports_value applies the field-type-specific rule."""
+        field = make_field_spec(field_key)
         candidate = make_candidate(
-            field="allergies",
-            raw_value="Penicillin, Peanuts",
-            normalized_value="penicillin, peanuts",  # Comma-separated
+            field=field_key,
+            raw_value=normalized_value,
+            normalized_value=normalized_value,
             doc_id="doc_001",
             page=1,
-            quoted_text="Allergies: Penicillin, Sulfa",  # Missing peanuts
+            quoted_text=quoted_text,
         )
 
-        assert evidence_supports_value(field, candidate) is False
+        assert evidence_supports_value(field, candidate) is expected
 
     def test_empty_evidence_rejected_by_model(self) -> None:
         """Empty evidence list is rejected by pydantic model.
@@ -350,40 +393,23 @@ class TestProvisionalConfidence:
 # --- Test extract_candidates_for_run ---
 
 
+@pytest.mark.xdist_group("extract_candidates_io")
 class TestExtractCandidatesForRun:
     """Tests for the main extraction orchestrator."""
 
-    def test_writes_candidates_json(self, tmp_path: Path) -> None:
+    def test_writes_candidates_json(
+        self, run_tree: Path, fake_llm: FakeLLMClient, default_run_options: RunOptions
+    ) -> None:
         """Extractor writes candidates.json artifact."""
-        run_id = "test-run-001"
-
-        schema = ResolvedSchema(
-            schema_source="fallback_v1",
-            resolved_fields=[make_field_spec("full_name")],
-        )
-
-        layout = [
-            make_layout_doc("doc_001", ["Patient Name: John Doe"]),
-        ]
-
-        routing = [
-            RoutingEntry(field="full_name", doc_ids=["doc_001"], scores={"doc_001": 0.8}),
-        ]
-
-        setup_run_artifacts(tmp_path, run_id, schema, layout, routing)
-
-        fake_llm = FakeLLMClient()
-        run_options = RunOptions()
-
         candidates = extract_candidates_for_run(
-            run_id,
-            run_options=run_options,
+            BASE_RUN_ID,
+            run_options=default_run_options,
             llm_client=fake_llm,
-            base_dir=str(tmp_path),
+            base_dir=str(run_tree),
         )
 
         # Check artifact was written
-        artifact_path = tmp_path / run_id / "artifacts" / "candidates.json"
+        artifact_path = run_tree / BASE_RUN_ID / "artifacts" / "candidates.json"
         assert artifact_path.exists()
 
         # Check content
@@ -391,7 +417,9 @@ class TestExtractCandidatesForRun:
         assert isinstance(data, list)
         assert len(data) >= 1
 
-    def test_includes_rejected_candidates_with_reasons(self, tmp_path: Path) -> None:
+    def test_includes_rejected_candidates_with_reasons(
+        self, tmp_path: Path, fake_llm: FakeLLMClient, default_run_options: RunOptions
+    ) -> None:
         """Rejected candidates are included with rejected_reasons populated."""
         run_id = "test-run-002"
 
@@ -402,7 +430,7 @@ class TestExtractCandidatesForRun:
 
         # Doc with name that won't match evidence check
         layout = [
-            make_layout_doc("doc_001", ["Name: X"]),  # Very short, likely won't validate
+            make_layout_doc("doc_001", ("Name: X",)),  # Very short, likely won't validate
         ]
 
         routing = [
@@ -411,12 +439,9 @@ class TestExtractCandidatesForRun:
 
         setup_run_artifacts(tmp_path, run_id, schema, layout, routing)
 
-        fake_llm = FakeLLMClient()
-        run_options = RunOptions()
-
         candidates = extract_candidates_for_run(
             run_id,
-            run_options=run_options,
+            run_options=default_run_options,
             llm_client=fake_llm,
             base_dir=str(tmp_path),
         )
@@ -427,34 +452,16 @@ class TestExtractCandidatesForRun:
             if c.rejected_reasons:
                 assert "unsupported_by_evidence" in c.rejected_reasons
 
-    def test_does_not_call_llm_if_heuristic_yields_acceptable(self, tmp_path: Path) -> None:
+    def test_does_not_call_llm_if_heuristic_yields_acceptable(
+        self, run_tree: Path, fake_llm: FakeLLMClient, default_run_options: RunOptions
+    ) -> None:
         """LLM is not called if heuristic yields acceptable candidate."""
-        run_id = "test-run-003"
-
-        schema = ResolvedSchema(
-            schema_source="fallback_v1",
-            resolved_fields=[make_field_spec("full_name")],
-        )
-
-        # Good match with anchor
-        layout = [
-            make_layout_doc("doc_001", ["Patient Name: John Doe"]),
-        ]
-
-        routing = [
-            RoutingEntry(field="full_name", doc_ids=["doc_001"], scores={"doc_001": 0.8}),
-        ]
-
-        setup_run_artifacts(tmp_path, run_id, schema, layout, routing)
-
-        fake_llm = FakeLLMClient()
-        run_options = RunOptions()
-
+        # Canonical run tree: "Patient Name: John Doe" is a good match with anchor
         extract_candidates_for_run(
-            run_id,
-            run_options=run_options,
+            BASE_RUN_ID,
+            run_options=default_run_options,
             llm_client=fake_llm,
-            base_dir=str(tmp_path),
+            base_dir=str(run_tree),
         )
 
         # Check LLM was not called
@@ -463,7 +470,9 @@ class TestExtractCandidatesForRun:
         # With anchor_match=1.0, provisional confidence = 0.45 < 0.75, so LLM WILL be called
         # This is correct per spec. Let's verify the behavior.
 
-    def test_calls_llm_once_if_heuristic_yields_none(self, tmp_path: Path) -> None:
+    def test_calls_llm_once_if_heuristic_yields_none(
+        self, tmp_path: Path, fake_llm: FakeLLMClient, default_run_options: RunOptions
+    ) -> None:
         """LLM is called once if heuristic yields no candidates."""
         run_id = "test-run-004"
 
@@ -474,7 +483,7 @@ class TestExtractCandidatesForRun:
 
         # No name pattern in doc
         layout = [
-            make_layout_doc("doc_001", ["Random text without name patterns"]),
+            make_layout_doc("doc_001", ("Random text without name patterns",)),
         ]
 
         routing = [
@@ -484,13 +493,11 @@ class TestExtractCandidatesForRun:
         setup_run_artifacts(tmp_path, run_id, schema, layout, routing)
 
         # Set up fake LLM to return empty
-        fake_llm = FakeLLMClient()
-        fake_llm.set_responses([[]])  # Return empty candidates
-        run_options = RunOptions()
+        fake_llm.set_responses(_empty_responses(1))  # Return empty candidates
 
         extract_candidates_for_run(
             run_id,
-            run_options=run_options,
+            run_options=default_run_options,
             llm_client=fake_llm,
             base_dir=str(tmp_path),
         )
@@ -500,7 +507,9 @@ class TestExtractCandidatesForRun:
         assert len(calls) == 1
         assert calls[0][0].key == "full_name"
 
-    def test_excerpt_capping_respects_limits(self, tmp_path: Path) -> None:
+    def test_excerpt_capping_respects_limits(
+        self, tmp_path: Path, fake_llm: FakeLLMClient, default_run_options: RunOptions
+    ) -> None:
         """Excerpt capping respects max limits."""
         run_id = "test-run-005"
 
@@ -510,9 +519,8 @@ class TestExtractCandidatesForRun:
         )
 
         # Large document
-        large_text = "Name: Test\n" + "x" * 10000
         layout = [
-            make_layout_doc("doc_001", [large_text]),
+            make_layout_doc("doc_001", (_LARGE_TEXT,)),
         ]
 
         routing = [
@@ -521,13 +529,11 @@ class TestExtractCandidatesForRun:
 
         setup_run_artifacts(tmp_path, run_id, schema, layout, routing)
 
-        fake_llm = FakeLLMClient()
-        fake_llm.set_responses([[]])
-        run_options = RunOptions()
+        fake_llm.set_responses(_empty_responses(1))
 
         extract_candidates_for_run(
             run_id,
-            run_options=run_options,
+            run_options=default_run_options,
             llm_client=fake_llm,
             base_dir=str(tmp_path),
         )
@@ -540,7 +546,9 @@ class TestExtractCandidatesForRun:
             # Should be capped at DEFAULT_MAX_TOTAL_CHARS (8000)
             assert total_chars <= 8000
 
-    def test_candidates_sorted_deterministically(self, tmp_path: Path) -> None:
+    def test_candidates_sorted_deterministically(
+        self, tmp_path: Path, fake_llm: FakeLLMClient, default_run_options: RunOptions
+    ) -> None:
         """Candidates are sorted by field, method, normalized_value."""
         run_id = "test-run-006"
 
@@ -553,9 +561,9 @@ class TestExtractCandidatesForRun:
         )
 
         layout = [
-            make_layout_doc("doc_001", [
+            make_layout_doc("doc_001", (
                 "Patient Name: John Doe\nDOB: 1990-01-15",
-            ]),
+            )),
         ]
 
         routing = [
@@ -565,13 +573,11 @@ class TestExtractCandidatesForRun:
 
         setup_run_artifacts(tmp_path, run_id, schema, layout, routing)
 
-        fake_llm = FakeLLMClient()
-        fake_llm.set_responses([[], []])  # Empty responses for both fields
-        run_options = RunOptions()
+        fake_llm.set_responses(_empty_responses(2))  # Empty responses for both fields
 
         candidates = extract_candidates_for_run(
             run_id,
-            run_options=run_options,
+            run_options=default_run_options,
             llm_client=fake_llm,
             base_dir=str(tmp_path),
         )
@@ -586,34 +592,24 @@ class TestExtractCandidatesForRun:
             if dob_indices and name_indices:
                 assert max(dob_indices) < min(name_indices)
 
-    def test_no_routed_docs_skips_field(self, tmp_path: Path) -> None:
+    def test_no_routed_docs_skips_field(
+        self, run_tree: Path, fake_llm: FakeLLMClient, default_run_options: RunOptions
+    ) -> None:
         """Field with no routed docs produces no candidates."""
-        run_id = "test-run-007"
-
-        schema = ResolvedSchema(
-            schema_source="fallback_v1",
-            resolved_fields=[make_field_spec("full_name")],
-        )
-
-        layout = [
-            make_layout_doc("doc_001", ["Some text"]),
-        ]
-
-        # Empty routing for full_name
+        # Empty routing for full_name (replaces the linked artifact atomically)
         routing = [
             RoutingEntry(field="full_name", doc_ids=[], scores={}),
         ]
-
-        setup_run_artifacts(tmp_path, run_id, schema, layout, routing)
-
-        fake_llm = FakeLLMClient()
-        run_options = RunOptions()
+        write_json_atomic(
+            run_tree / BASE_RUN_ID / "artifacts" / "routing.json",
+            [entry.model_dump() for entry in routing],
+        )
 
         candidates = extract_candidates_for_run(
-            run_id,
-            run_options=run_options,
+            BASE_RUN_ID,
+            run_options=default_run_options,
             llm_client=fake_llm,
-            base_dir=str(tmp_path),
+            base_dir=str(run_tree),
         )
 
         # No candidates for full_name (no routed docs)
@@ -623,7 +619,9 @@ class TestExtractCandidatesForRun:
         # LLM should not have been called
         assert len(fake_llm.get_calls()) == 0
 
-    def test_llm_error_continues_processing(self, tmp_path: Path) -> None:
+    def test_llm_error_continues_processing(
+        self, tmp_path: Path, fake_llm: FakeLLMClient, default_run_options: RunOptions
+    ) -> None:
         """LLM error for one field doesn't stop other fields."""
         run_id = "test-run-008"
 
@@ -637,7 +635,7 @@ class TestExtractCandidatesForRun:
 
         # No heuristic matches - will trigger LLM for both
         layout = [
-            make_layout_doc("doc_001", ["random text"]),
+            make_layout_doc("doc_001", ("random text",)),
         ]
 
         routing = [
@@ -648,17 +646,15 @@ class TestExtractCandidatesForRun:
         setup_run_artifacts(tmp_path, run_id, schema, layout, routing)
 
         # First call errors, second succeeds
-        fake_llm = FakeLLMClient()
         fake_llm.set_responses([
             LLMInvalidJSONError("dob", "test error"),  # dob comes first alphabetically
             [],  # full_name
         ])
-        run_options = RunOptions()
 
         # Should not raise - continues to next field
         candidates = extract_candidates_for_run(
             run_id,
-            run_options=run_options,
+            run_options=default_run_options,
             llm_client=fake_llm,
             base_dir=str(tmp_path),
         )
@@ -673,8 +669,10 @@ class TestExtractCandidatesForRun:
 class TestDeterministicOrdering:
     """Tests for deterministic output ordering."""
 
-    def test_same_input_same_output(self, tmp_path: Path) -> None:
-        """Same input produces same output ordering."""
+    def test_same_input_same_output(
+        self, tmp_path: Path, fake_llm: FakeLLMClient, default_run_options: RunOptions
+    ) -> None:
+        """Output matches the checked-in snapshot (field, normalized_value) ordering."""
         run_id = "test-deterministic"
 
         schema = ResolvedSchema(
@@ -687,9 +685,9 @@ class TestDeterministicOrdering:
         )
 
         layout = [
-            make_layout_doc("doc_001", [
+            make_layout_doc("doc_001", (
                 "Name: John Doe\nPhone: 555-123-4567\nAddress: 123 Main St",
-            ]),
+            )),
         ]
 
         routing = [
@@ -698,24 +696,21 @@ class TestDeterministicOrdering:
             RoutingEntry(field="address", doc_ids=["doc_001"], scores={"doc_001": 0.8}),
         ]
 
-        # Run twice
-        results = []
-        for i in range(2):
-            run_id_i = f"{run_id}-{i}"
-            setup_run_artifacts(tmp_path, run_id_i, schema, layout, routing)
-
-            fake_llm = FakeLLMClient()
-            fake_llm.set_responses([[], [], []])
-            run_options = RunOptions()
-
-            candidates = extract_candidates_for_run(
-                run_id_i,
-                run_options=run_options,
-                llm_client=fake_llm,
-                base_dir=str(tmp_path),
-            )
-            results.append([(c.field, c.normalized_value) for c in candidates])
+        setup_run_artifacts(tmp_path, run_id, schema, layout, routing)
+
+        fake_llm.set_responses(_empty_responses(3))
 
-        # Should be identical
-        assert results[0] == results[1]
+        candidates = extract_candidates_for_run(
+            run_id,
+            run_options=default_run_options,
+            llm_client=fake_llm,
+            base_dir=str(tmp_path),
+        )
 
+        # A single run compared against a fixed snapshot pins the ordering
+        # as tightly as comparing two runs, at half the cost
+        assert [(c.field, c.normalized_value) for c in candidates] == [
+            ("address", "123 main st"),
+            ("full_name", "john doe"),
+            ("phone", "15551234567"),
+        ]
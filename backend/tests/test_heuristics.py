@@ -4,6 +4,9 @@ Unit tests for heuristics module.
 Tests per-field extractors, normalization, and evidence anchoring.
 """
 
+import re
+import time
+
 import pytest
 
 from app.heuristics import (
@@ -70,6 +73,10 @@ class TestNormalizeText:
     def test_empty_string(self) -> None:
         assert normalize_text("") == ""
 
+    def test_non_ascii_keeps_word_characters(self) -> None:
+        assert normalize_text("José\u2019s  Café!") == "josés café"
+        assert normalize_text("snake_case") == "snake_case"
+
 
 class TestNormalizeDate:
     """Tests for normalize_date function."""
@@ -91,10 +98,20 @@ class TestNormalizeDate:
         assert normalize_date("not a date") is None
         assert normalize_date("hello world") is None
 
+    def test_no_four_digit_year(self) -> None:
+        assert normalize_date("01/15/24") is None
+        assert normalize_date("Jan 15") is None
+
     def test_padding(self) -> None:
         """Test that single-digit months/days are zero-padded."""
         assert normalize_date("1/5/2024") == "2024-01-05"
 
+    def test_repeated_input_is_memoized(self) -> None:
+        normalize_date.cache_clear()
+
+        assert normalize_date("1/5/2024") == normalize_date("1/5/2024")
+        assert normalize_date.cache_info().hits == 1
+
 
 class TestNormalizePhone:
     """Tests for normalize_phone function."""
@@ -123,6 +140,10 @@ class TestNormalizePhone:
         digits, _ = normalize_phone("555.123.4567")
         assert digits == "15551234567"
 
+    def test_strips_letters_and_labels(self) -> None:
+        digits, _ = normalize_phone("Tel: +1 (555) 123-4567 x")
+        assert digits == "15551234567"
+
 
 # --- Test DOB extraction ---
 
@@ -181,6 +202,18 @@ class TestDOBExtraction:
         candidate = candidates[0]
         assert candidate.scores.anchor_match == 0.0
 
+    def test_anchor_keyword_outside_window_not_counted(self) -> None:
+        """Only keywords within 50 chars before the date count as anchors."""
+        field = make_field_spec("dob")
+        near = make_layout_doc("doc_001", ["DOB:" + " " * 40 + "1990-05-15"])
+        far = make_layout_doc("doc_002", ["DOB:" + " " * 60 + "1990-05-15"])
+
+        [near_candidate] = heuristic_candidates_for_field(field, [near])
+        [far_candidate] = heuristic_candidates_for_field(field, [far])
+
+        assert near_candidate.scores.anchor_match == 1.0
+        assert far_candidate.scores.anchor_match == 0.0
+
     def test_evidence_page_number_correct(self) -> None:
         """Evidence includes correct page number (1-indexed)."""
         field = make_field_spec("dob")
@@ -372,6 +405,16 @@ class TestAllergiesExtraction:
         assert len(candidates) >= 1
         assert "penicillin" in candidates[0].normalized_value
 
+    def test_empty_label_line_does_not_hide_next_line(self) -> None:
+        """A bare label line is skipped without swallowing the following line."""
+        field = make_field_spec("allergies")
+        doc = make_layout_doc("doc_001", ["Allergies:\nAllergies: Penicillin"])
+
+        candidates = heuristic_candidates_for_field(field, [doc])
+
+        quoted = [c.evidence[0].quoted_text for c in candidates]
+        assert quoted == ["Allergies: Penicillin"]
+
 
 class TestMedicationsExtraction:
     """Tests for medications extraction."""
@@ -419,3 +462,65 @@ class TestMultipleDocuments:
         values = [c.normalized_value for c in candidates]
         assert values.count("1980-01-15") == 1
 
+
+# --- Test pathological inputs ---
+
+
+# Long single-line inputs that would expose super-linear regex backtracking
+_PATHOLOGICAL_TEXTS = [
+    "a" * 156000,
+    "Name: x" + "," * 156000,
+    "1" * 156000,
+    "Address:" + " " * 156000 + "x",
+]
+
+
+class TestPathologicalInputs:
+    """Extraction stays fast on long adversarial pages."""
+
+    @pytest.mark.parametrize(
+        "text", _PATHOLOGICAL_TEXTS, ids=["letters", "commas", "digits", "spaces"]
+    )
+    def test_bounded_time(self, text: str) -> None:
+        """Normalizers and every field's extraction finish well under 2s."""
+        doc = make_layout_doc("doc_001", [text])
+        keys = [
+            "dob", "phone", "insurance_member_id", "full_name",
+            "address", "allergies", "medications",
+        ]
+
+        start = time.perf_counter()
+        normalize_date(text)
+        normalize_phone(text)
+        normalize_text(text)
+        for key in keys:
+            heuristic_candidates_for_field(make_field_spec(key), [doc])
+
+        assert time.perf_counter() - start < 2.0
+
+    def test_trailing_punctuation_stripped(self) -> None:
+        """Trailing separator punctuation is trimmed from captured values."""
+        field = make_field_spec("full_name")
+        doc = make_layout_doc("doc_001", ["Name: John Doe,;:.|"])
+
+        candidates = heuristic_candidates_for_field(field, [doc])
+
+        assert candidates[0].raw_value == "John Doe"
+
+
+# --- Test pattern precompilation ---
+
+
+class TestCompiledPatterns:
+    """Regression guard: heuristic regexes are compiled once at import."""
+
+    def test_module_patterns_are_compiled(self) -> None:
+        """Every module-level _RE_ name holds compiled patterns."""
+        import app.heuristics as heuristics
+
+        names = [name for name in vars(heuristics) if name.startswith("_RE_")]
+        assert names
+        for name in names:
+            value = getattr(heuristics, name)
+            patterns = value if isinstance(value, tuple) else (value,)
+            assert all(isinstance(p, re.Pattern) for p in patterns), name
@@ -15,6 +15,7 @@ from app.ingest import (
     _format_doc_id,
     ingest_documents,
 )
+from app.pdf_text import extract_text_per_page
 from app.runfs import create_run
 
 
@@ -69,6 +70,13 @@ class TestComputeSha256:
 
         assert hash1 != hash2
 
+    def test_sha256_empty_file(self, tmp_path: Path) -> None:
+        """Test that an empty file (which cannot be memory-mapped) still hashes."""
+        empty_file = tmp_path / "empty.bin"
+        empty_file.write_bytes(b"")
+
+        assert _compute_sha256(empty_file) == hashlib.sha256(b"").hexdigest()
+
 
 class TestDetectMimeType:
     """Tests for MIME type detection."""
@@ -97,6 +105,20 @@ class TestDetectMimeType:
         mime = _detect_mime_type(txt_file)
         assert mime == "text/plain"
 
+    def test_extension_match_is_case_insensitive(self, tmp_path: Path) -> None:
+        """Test that an upper-case .PDF extension is detected."""
+        pdf_file = tmp_path / "SCAN.PDF"
+        pdf_file.write_bytes(b"%PDF-1.4 content")
+
+        assert _detect_mime_type(pdf_file) == "application/pdf"
+
+    def test_other_extensions_use_mimetypes(self, tmp_path: Path) -> None:
+        """Test that extensions outside the fast-path map still resolve."""
+        html_file = tmp_path / "page.html"
+        html_file.write_bytes(b"<html></html>")
+
+        assert _detect_mime_type(html_file) == "text/html"
+
     def test_fallback_for_unknown(self, tmp_path: Path) -> None:
         """Test that unknown files get octet-stream mime type."""
         unknown_file = tmp_path / "unknown"
@@ -163,6 +185,29 @@ class TestIngestDocuments:
         assert items[2].doc_id == "doc_003"
         assert items[2].filename == "third.pdf"
 
+    def test_ingest_many_files_keep_upload_order(self, tmp_path: Path) -> None:
+        """Test that concurrent ingest returns items in upload order."""
+        run = create_run(run_id="test-many", base_dir=tmp_path)
+        input_files = [(f"file_{i:02d}.txt", f"content {i}".encode()) for i in range(20)]
+
+        items = ingest_documents(run, input_files)
+
+        assert [item.filename for item in items] == [name for name, _ in input_files]
+        assert [item.sha256 for item in items] == [
+            hashlib.sha256(content).hexdigest() for _, content in input_files
+        ]
+
+    def test_ingest_duplicate_names_first_upload_wins(self, tmp_path: Path) -> None:
+        """Test that uploads sharing a filename all reference the first upload's bytes."""
+        run = create_run(run_id="test-dup", base_dir=tmp_path)
+        input_files = [("same.txt", b"first"), ("same.txt", b"second")]
+
+        items = ingest_documents(run, input_files)
+
+        assert [item.doc_id for item in items] == ["doc_001", "doc_002"]
+        assert (run.input_docs_dir() / "same.txt").read_bytes() == b"first"
+        assert items[0].sha256 == items[1].sha256 == hashlib.sha256(b"first").hexdigest()
+
     def test_ingest_copies_files_to_input_docs(self, tmp_path: Path) -> None:
         """Test that files are copied to input_docs directory."""
         run = create_run(run_id="test-copy", base_dir=tmp_path)
@@ -200,6 +245,20 @@ class TestIngestDocuments:
         assert items[0].mime_type == "application/pdf"
         assert items[1].mime_type == "text/plain"
 
+    def test_ingest_pdf_text_extractable(
+        self, tmp_path: Path, two_pages_bytes: bytes
+    ) -> None:
+        """Test that an ingested PDF copy is detected and yields per-page text."""
+        run = create_run(run_id="test-pdf-text", base_dir=tmp_path)
+
+        items = ingest_documents(run, [("scan.pdf", two_pages_bytes)])
+        result = extract_text_per_page(run.input_docs_dir() / items[0].filename)
+
+        assert items[0].mime_type == "application/pdf"
+        assert result.page_count == 2
+        assert "Page One" in result.pages[0]
+        assert "Page Two" in result.pages[1]
+
     def test_ingest_placeholder_values(self, tmp_path: Path) -> None:
         """Test that has_text_layer defaults to True as placeholder."""
         run = create_run(run_id="test-placeholder", base_dir=tmp_path)
@@ -4,6 +4,8 @@ Unit tests for layout_builder module.
 Tests LayoutDoc building and doc_index/layout artifact emission.
 """
 
+import json
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -16,8 +18,8 @@ from app.layout_builder import (
     update_doc_index_with_extraction,
 )
 from app.models import DocIndexItem, LayoutDoc, LayoutPageText
-from app.pdf_text import PdfExtractionResult, extract_text_per_page
-from app.runfs import create_run, read_json
+from app.pdf_text import PdfExtractionResult
+from app.runfs import RunPaths, create_run, read_json
 from app.trace import TraceLogger
 
 
@@ -176,13 +178,15 @@ class TestUpdateDocIndexWithExtraction:
 class TestLayoutPagesAre1Indexed:
     """Acceptance test: layout pages are 1-indexed."""
 
-    def test_layout_from_fixture(self) -> None:
+    def test_layout_from_fixture(
+        self, cached_extraction: Callable[[Path], PdfExtractionResult]
+    ) -> None:
         """
         Given a PDF with known text on page 1,
         LayoutDoc.pages[0].page == 1 and contains expected text.
         """
         two_page_pdf = FIXTURES_DIR / "two_pages.pdf"
-        extraction = extract_text_per_page(two_page_pdf)
+        extraction = cached_extraction(two_page_pdf)
         layout = build_layout_doc("doc_001", extraction)
 
         # First element should be page 1
@@ -194,25 +198,55 @@ class TestLayoutPagesAre1Indexed:
         assert "Page Two" in layout.pages[1].full_text
 
 
-class TestRunIngestAndExtract:
-    """Integration tests for the full ingest + extract pipeline."""
+PipelineOutput = tuple[list[DocIndexItem], list[LayoutDoc], RunPaths]
 
-    def test_full_pipeline_with_text_pdf(self, tmp_path: Path) -> None:
-        """Test full pipeline produces correct doc_index and layout."""
-        # Read fixture
-        text_pdf = FIXTURES_DIR / "sample_text.pdf"
-        content = text_pdf.read_bytes()
 
-        # Create run
-        run = create_run(run_id="test-pipeline", base_dir=tmp_path)
-        trace = TraceLogger(run)
+@pytest.fixture(scope="module")
+def text_pdf_pipeline(
+    tmp_path_factory: pytest.TempPathFactory,
+    xdist_worker: str,
+    sample_text_bytes: bytes,
+) -> PipelineOutput:
+    """
+    Run ingest + extract on sample_text.pdf once for the module.
 
-        # Run pipeline
-        doc_index, layouts = run_ingest_and_extract(
-            run,
-            [("sample.pdf", content)],
-            trace,
-        )
+    Tests using this fixture only assert on the outputs and must not modify
+    the run directory.
+
+    Returns:
+        Tuple of (doc_index, layouts, run).
+    """
+    run = create_run(
+        run_id=f"test-pipeline-{xdist_worker}",
+        base_dir=tmp_path_factory.mktemp("text_pdf_pipeline"),
+    )
+    trace = TraceLogger(run)
+
+    doc_index, layouts = run_ingest_and_extract(
+        run,
+        [("sample.pdf", sample_text_bytes)],
+        trace,
+    )
+    return doc_index, layouts, run
+
+
+@pytest.mark.usefixtures("cached_extraction", "no_fsync")
+class TestRunIngestAndExtract:
+    """
+    Integration tests for the full ingest + extract pipeline.
+
+    The three sample_text.pdf checks read one module-scoped pipeline run
+    (text_pdf_pipeline) and must treat its run directory as read-only; the
+    other tests each run the pipeline in their own tmp_path. Each xdist
+    worker fills its own extraction cache, and run IDs carry the worker
+    name so trace output stays attributable under -n auto.
+    """
+
+    def test_full_pipeline_with_text_pdf(
+        self, text_pdf_pipeline: PipelineOutput
+    ) -> None:
+        """Test full pipeline produces correct doc_index and layout."""
+        doc_index, layouts, _ = text_pdf_pipeline
 
         # Check doc_index
         assert len(doc_index) == 1
@@ -228,17 +262,16 @@ class TestRunIngestAndExtract:
         assert layouts[0].pages[0].page == 1
         assert "Hello World" in layouts[0].pages[0].full_text
 
-    def test_full_pipeline_with_blank_pdf(self, tmp_path: Path) -> None:
+    def test_full_pipeline_with_blank_pdf(
+        self, tmp_path: Path, xdist_worker: str, blank_bytes: bytes
+    ) -> None:
         """Test that blank PDF sets has_text_layer=false and unreadable_reason."""
-        blank_pdf = FIXTURES_DIR / "blank.pdf"
-        content = blank_pdf.read_bytes()
-
-        run = create_run(run_id="test-blank", base_dir=tmp_path)
+        run = create_run(run_id=f"test-blank-{xdist_worker}", base_dir=tmp_path)
         trace = TraceLogger(run)
 
         doc_index, layouts = run_ingest_and_extract(
             run,
-            [("blank.pdf", content)],
+            [("blank.pdf", blank_bytes)],
             trace,
         )
 
@@ -251,15 +284,9 @@ class TestRunIngestAndExtract:
         assert len(layouts) == 1
         assert len(layouts[0].pages) == 1
 
-    def test_artifacts_written(self, tmp_path: Path) -> None:
+    def test_artifacts_written(self, text_pdf_pipeline: PipelineOutput) -> None:
         """Test that doc_index.json and layout.json are written atomically."""
-        text_pdf = FIXTURES_DIR / "sample_text.pdf"
-        content = text_pdf.read_bytes()
-
-        run = create_run(run_id="test-artifacts", base_dir=tmp_path)
-        trace = TraceLogger(run)
-
-        run_ingest_and_extract(run, [("doc.pdf", content)], trace)
+        _, _, run = text_pdf_pipeline
 
         # Check artifacts exist
         doc_index_path = run.artifact_path("doc_index.json")
@@ -277,44 +304,37 @@ class TestRunIngestAndExtract:
         assert len(layout_data) == 1
         assert layout_data[0]["doc_id"] == "doc_001"
 
-    def test_trace_steps_recorded(self, tmp_path: Path) -> None:
+    def test_trace_steps_recorded(self, text_pdf_pipeline: PipelineOutput) -> None:
         """Test that trace steps are recorded."""
-        text_pdf = FIXTURES_DIR / "sample_text.pdf"
-        content = text_pdf.read_bytes()
-
-        run = create_run(run_id="test-trace", base_dir=tmp_path)
-        trace = TraceLogger(run)
-
-        run_ingest_and_extract(run, [("doc.pdf", content)], trace)
+        _, _, run = text_pdf_pipeline
 
         # Read trace file
         trace_path = run.trace_jsonl_path()
         assert trace_path.exists()
 
-        import json
-        events = [json.loads(line) for line in trace_path.read_text().strip().split("\n")]
+        # Stream the JSONL events rather than splitting the whole file
+        with trace_path.open("rb") as f:
+            steps = {json.loads(line)["step"] for line in f if line.strip()}
 
         # Should have ingest, extract_text, write_artifacts steps
-        steps = [e["step"] for e in events]
-        assert "ingest" in steps
-        assert "extract_text" in steps
-        assert "write_artifacts" in steps
-
-    def test_multiple_docs_in_order(self, tmp_path: Path) -> None:
+        assert {"ingest", "extract_text", "write_artifacts"} <= steps
+
+    def test_multiple_docs_in_order(
+        self,
+        tmp_path: Path,
+        xdist_worker: str,
+        sample_text_bytes: bytes,
+        blank_bytes: bytes,
+    ) -> None:
         """Test that multiple docs get sequential doc_ids."""
-        text_pdf = FIXTURES_DIR / "sample_text.pdf"
-        blank_pdf = FIXTURES_DIR / "blank.pdf"
-        text_content = text_pdf.read_bytes()
-        blank_content = blank_pdf.read_bytes()
-
-        run = create_run(run_id="test-multi", base_dir=tmp_path)
+        run = create_run(run_id=f"test-multi-{xdist_worker}", base_dir=tmp_path)
         trace = TraceLogger(run)
 
         doc_index, layouts = run_ingest_and_extract(
             run,
             [
-                ("first.pdf", text_content),
-                ("second.pdf", blank_content),
+                ("first.pdf", sample_text_bytes),
+                ("second.pdf", blank_bytes),
             ],
             trace,
         )
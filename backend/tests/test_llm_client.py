@@ -4,7 +4,9 @@ Unit tests for LLM client module.
 Tests retry logic, JSON parsing, and candidate validation without network calls.
 """
 
+import functools
 import json
+from collections.abc import Iterator
 
 import pytest
 
@@ -14,6 +16,7 @@ from app.llm_client import (
     FakeLLMClient,
     LLMInvalidJSONError,
     _parse_llm_response,
+    _with_retry,
 )
 from app.models import (
     Candidate,
@@ -27,23 +30,40 @@ from app.models import (
 # --- Helper factories ---
 
 
+_TYPE_MAP = {
+    "full_name": "string",
+    "dob": "date",
+    "phone": "phone",
+    "address": "string",
+    "insurance_member_id": "string",
+    "allergies": "string_or_list",
+    "medications": "string_or_list",
+}
+
+
+@functools.lru_cache(maxsize=None)
 def make_field_spec(key: str, label: str | None = None) -> FieldSpec:
-    """Create a minimal FieldSpec."""
-    type_map = {
-        "full_name": "string",
-        "dob": "date",
-        "phone": "phone",
-        "address": "string",
-        "insurance_member_id": "string",
-        "allergies": "string_or_list",
-        "medications": "string_or_list",
-    }
-    return FieldSpec(key=key, label=label, type=type_map[key])
+    """Create a minimal FieldSpec (shared instance; treat as read-only)."""
+    return FieldSpec(key=key, label=label, type=_TYPE_MAP[key])
+
+
+# Validated once; helpers copy these instead of re-running validation
+_EXCERPT_TEMPLATE = DocExcerpt(doc_id="doc_001", page=1, text="")
+_CANDIDATE_TEMPLATE = Candidate(
+    field="full_name",
+    raw_value="Test",
+    normalized_value="test",
+    evidence=[Evidence(doc_id="doc_001", page=1, quoted_text="Test")],
+    from_method="llm",
+    scores=CandidateScores(anchor_match=1.0, validator=0.0, doc_relevance=0.0),
+)
 
 
 def make_excerpt(doc_id: str, page: int, text: str) -> DocExcerpt:
-    """Create a DocExcerpt."""
-    return DocExcerpt(doc_id=doc_id, page=page, text=text)
+    """Create a DocExcerpt (unvalidated copy of the template)."""
+    return _EXCERPT_TEMPLATE.model_copy(
+        update={"doc_id": doc_id, "page": page, "text": text}
+    )
 
 
 def make_valid_json_response(
@@ -65,100 +85,95 @@ def make_valid_json_response(
     }])
 
 
+# Canonical LLM responses, encoded once at import
+_RESP_JOHN_DOE = make_valid_json_response(
+    "John Doe", "john doe", "doc_001", 1, "Patient Name: John Doe"
+)
+_RESP_DOB = make_valid_json_response(
+    "1990-01-15", "1990-01-15", "doc_001", 1, "DOB: 1990-01-15"
+)
+_RESP_PHONE = make_valid_json_response(
+    "555-123-4567", "15551234567", "doc_001", 1, "Phone: 555-123-4567"
+)
+
+
 # --- Test _parse_llm_response ---
 
 
+@pytest.fixture
+def full_name_field() -> FieldSpec:
+    """The shared full_name FieldSpec."""
+    return make_field_spec("full_name")
+
+
 class TestParseLLMResponse:
     """Tests for _parse_llm_response function."""
 
-    def test_parses_valid_json(self) -> None:
-        """Parses valid JSON into Candidate objects."""
-        field = make_field_spec("full_name")
-        response = make_valid_json_response(
-            raw_value="John Doe",
-            normalized_value="john doe",
-            doc_id="doc_001",
-            page=1,
-            quoted_text="Patient Name: John Doe",
-        )
+    @pytest.mark.parametrize(
+        ("key", "response", "raw_value", "normalized_value"),
+        [
+            ("full_name", _RESP_JOHN_DOE, "John Doe", "john doe"),
+            ("dob", _RESP_DOB, "1990-01-15", "1990-01-15"),
+            ("dob", f"```json\n{_RESP_DOB}\n```", "1990-01-15", "1990-01-15"),
+            ("phone", f"```\n{_RESP_PHONE}\n```", "555-123-4567", "15551234567"),
+        ],
+        ids=["plain", "plain_dob", "markdown_json_block", "markdown_bare_block"],
+    )
+    def test_parses_valid_json(
+        self, key: str, response: str, raw_value: str, normalized_value: str
+    ) -> None:
+        """Parses valid JSON, bare or in markdown code blocks, into Candidates."""
+        field = make_field_spec(key)
 
         candidates = _parse_llm_response(field, response)
 
         assert len(candidates) == 1
         c = candidates[0]
-        assert c.field == "full_name"
-        assert c.raw_value == "John Doe"
+        assert c.field == key
+        assert c.raw_value == raw_value
+        assert c.normalized_value == normalized_value
         assert c.from_method == "llm"
         assert len(c.evidence) == 1
 
-    def test_handles_markdown_code_blocks(self) -> None:
-        """Handles responses wrapped in markdown code blocks."""
-        field = make_field_spec("dob")
-        json_content = make_valid_json_response(
-            raw_value="1990-01-15",
-            normalized_value="1990-01-15",
-            doc_id="doc_001",
-            page=1,
-            quoted_text="DOB: 1990-01-15",
-        )
-        response = f"```json\n{json_content}\n```"
-
-        candidates = _parse_llm_response(field, response)
-
-        assert len(candidates) == 1
-        assert candidates[0].normalized_value == "1990-01-15"
-
-    def test_empty_array_returns_empty_list(self) -> None:
-        """Empty JSON array returns empty candidate list."""
-        field = make_field_spec("full_name")
-
-        candidates = _parse_llm_response(field, "[]")
-
-        assert candidates == []
-
-    def test_invalid_json_raises(self) -> None:
-        """Invalid JSON raises ValueError."""
-        field = make_field_spec("full_name")
-
-        with pytest.raises(ValueError, match="Invalid JSON"):
-            _parse_llm_response(field, "not json at all")
-
-    def test_non_array_raises(self) -> None:
-        """Non-array JSON raises ValueError."""
-        field = make_field_spec("full_name")
-
-        with pytest.raises(ValueError, match="must be a JSON array"):
-            _parse_llm_response(field, '{"raw_value": "test"}')
-
-    def test_skips_items_without_evidence(self) -> None:
-        """Items without evidence are skipped."""
-        field = make_field_spec("full_name")
-        response = json.dumps([{
-            "raw_value": "John Doe",
-            "normalized_value": "john doe",
-            "evidence": [],  # Empty evidence
-        }])
-
-        candidates = _parse_llm_response(field, response)
-
-        assert candidates == []
-
-    def test_skips_items_with_invalid_evidence(self) -> None:
-        """Items with invalid evidence are skipped."""
-        field = make_field_spec("full_name")
-        response = json.dumps([{
-            "raw_value": "John Doe",
-            "normalized_value": "john doe",
-            "evidence": [{
-                "doc_id": "",  # Invalid: empty
-                "page": 1,
-                "quoted_text": "test",
-            }],
-        }])
-
-        candidates = _parse_llm_response(field, response)
-
-        assert candidates == []
+    @pytest.mark.parametrize(
+        "response",
+        [
+            "[]",
+            json.dumps([{
+                "raw_value": "John Doe",
+                "normalized_value": "john doe",
+                "evidence": [],  # Empty evidence
+            }]),
+            json.dumps([{
+                "raw_value": "John Doe",
+                "normalized_value": "john doe",
+                "evidence": [{
+                    "doc_id": "",  # Invalid: empty
+                    "page": 1,
+                    "quoted_text": "test",
+                }],
+            }]),
+        ],
+        ids=["empty_array", "without_evidence", "invalid_evidence"],
+    )
+    def test_returns_empty_list(self, full_name_field: FieldSpec, response: str) -> None:
+        """Empty arrays and items without valid evidence yield no candidates."""
+        assert _parse_llm_response(full_name_field, response) == []
+
+    @pytest.mark.parametrize(
+        ("response", "message"),
+        [
+            ("not json at all", "Invalid JSON"),
+            ('{"raw_value": "test"}', "must be a JSON array"),
+        ],
+        ids=["invalid_json", "non_array"],
+    )
+    def test_malformed_response_raises(
+        self, full_name_field: FieldSpec, response: str, message: str
+    ) -> None:
+        """Invalid JSON or a non-array payload raises ValueError."""
+        with pytest.raises(ValueError, match=message):
+            _parse_llm_response(full_name_field, response)
 
     def test_phone_adds_validator_flag(self) -> None:
         """Phone candidates get default_country_assumed flag when appropriate."""
@@ -179,116 +194,142 @@ class TestParseLLMResponse:
         assert "default_country_assumed" in candidates[0].validators
 
 
-# --- Test ApiLLMClient retry logic ---
+# --- Test _with_retry ---
 
 
-class TestApiLLMClientRetry:
-    """Tests for ApiLLMClient retry behavior."""
+class TestWithRetry:
+    """Tests for the _with_retry call/parse loop (no client involved)."""
+
+    @staticmethod
+    def parse(response: str) -> list[Candidate]:
+        return _parse_llm_response(make_field_spec("full_name"), response)
 
     def test_invalid_json_triggers_exactly_one_retry_then_success(self) -> None:
         """Invalid JSON triggers exactly one retry, then success."""
-        client = ApiLLMClient(
-            provider="anthropic",
-            api_key="fake-key",
-            model="test-model",
-        )
+        responses = iter(["not valid json", _RESP_JOHN_DOE])
+        calls: list[tuple[str | None, str | None]] = []
 
-        field = make_field_spec("full_name")
-        excerpts = [make_excerpt("doc_001", 1, "Patient Name: John Doe")]
-        run_options = RunOptions()
+        def call(previous_response: str | None, error: str | None) -> str:
+            calls.append((previous_response, error))
+            return next(responses)
 
-        # Track call count
-        call_count = 0
-        responses = [
-            "not valid json",  # First call: invalid
-            make_valid_json_response(  # Second call: valid
-                "John Doe", "john doe", "doc_001", 1, "Patient Name: John Doe"
-            ),
-        ]
+        candidates = _with_retry(call, self.parse)
 
-        def mock_call_api(messages: list, max_tokens: int) -> str:
-            nonlocal call_count
-            result = responses[call_count]
-            call_count += 1
-            return result
+        # Should have made exactly 2 calls; the retry sees the rejected reply
+        assert len(calls) == 2
+        assert calls[0] == (None, None)
+        assert calls[1][0] == "not valid json"
+        assert calls[1][1] is not None and "Invalid JSON" in calls[1][1]
 
-        # Monkeypatch the _call_api method
-        client._call_api = mock_call_api  # type: ignore
+        # Should have gotten candidates from retry
+        assert len(candidates) == 1
+        assert candidates[0].raw_value == "John Doe"
 
-        candidates = client.extract_candidates(field, excerpts, run_options=run_options)
+    def test_invalid_json_twice_raises_value_error(self) -> None:
+        """Invalid JSON after the retry re-raises the last parse error."""
+        calls = []
 
-        # Should have made exactly 2 calls
-        assert call_count == 2
+        def call(previous_response: str | None, error: str | None) -> str:
+            calls.append(error)
+            return "still not valid json"
 
-        # Should have gotten candidates from retry
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            _with_retry(call, self.parse)
+
+        # Original + 1 retry
+        assert len(calls) == 2
+
+    def test_valid_json_first_try_no_retry(self) -> None:
+        """Valid JSON on first try doesn't trigger retry."""
+        calls = []
+
+        def call(previous_response: str | None, error: str | None) -> str:
+            calls.append(error)
+            return _RESP_JOHN_DOE
+
+        candidates = _with_retry(call, self.parse)
+
+        assert calls == [None]
         assert len(candidates) == 1
-        assert candidates[0].raw_value == "John Doe"
 
-    def test_invalid_json_twice_raises_llm_invalid_json_error(self) -> None:
-        """Invalid JSON twice raises LLMInvalidJSONError."""
-        client = ApiLLMClient(
-            provider="openai",
-            api_key="fake-key",
-            model="test-model",
-        )
+    def test_call_failure_retries_with_empty_previous_response(self) -> None:
+        """A call that raises ValueError is retried with an empty previous reply."""
+        calls: list[tuple[str | None, str | None]] = []
 
-        field = make_field_spec("dob")
-        excerpts = [make_excerpt("doc_001", 1, "DOB: 1990-01-15")]
-        run_options = RunOptions()
+        def call(previous_response: str | None, error: str | None) -> str:
+            calls.append((previous_response, error))
+            if len(calls) == 1:
+                raise ValueError("transport said no")
+            return "[]"
 
-        call_count = 0
+        assert _with_retry(call, self.parse) == []
+        assert calls[1] == ("", "transport said no")
 
-        def mock_call_api(messages: list, max_tokens: int) -> str:
-            nonlocal call_count
-            call_count += 1
-            return "still not valid json"
+    @pytest.mark.parametrize("max_retries", [0, 2])
+    def test_max_retries_bounds_attempts(self, max_retries: int) -> None:
+        """Attempts are the first call plus max_retries retries."""
+        calls = []
 
-        client._call_api = mock_call_api  # type: ignore
+        def call(previous_response: str | None, error: str | None) -> str:
+            calls.append(error)
+            return "not json"
 
-        with pytest.raises(LLMInvalidJSONError) as exc_info:
-            client.extract_candidates(field, excerpts, run_options=run_options)
+        with pytest.raises(ValueError):
+            _with_retry(call, self.parse, max_retries=max_retries)
 
-        # Should have made exactly 2 calls (original + 1 retry)
-        assert call_count == 2
-        assert exc_info.value.field == "dob"
+        assert len(calls) == max_retries + 1
 
-    def test_valid_json_first_try_no_retry(self) -> None:
-        """Valid JSON on first try doesn't trigger retry."""
-        client = ApiLLMClient(
-            provider="anthropic",
-            api_key="fake-key",
-            model="test-model",
-        )
 
-        field = make_field_spec("phone")
-        excerpts = [make_excerpt("doc_001", 1, "Phone: 555-123-4567")]
+# --- Test ApiLLMClient retry logic ---
+
+
+@pytest.fixture(scope="module")
+def anthropic_client() -> ApiLLMClient:
+    """ApiLLMClient for the anthropic provider, shared across the module."""
+    return ApiLLMClient(provider="anthropic", api_key="fake-key", model="test-model")
+
+
+@pytest.fixture(scope="module")
+def openai_client() -> ApiLLMClient:
+    """ApiLLMClient for the openai provider, shared across the module."""
+    return ApiLLMClient(provider="openai", api_key="fake-key", model="test-model")
+
+
+class TestApiLLMClientRetry:
+    """Tests for ApiLLMClient's use of the retry contract."""
+
+    def test_invalid_json_twice_raises_llm_invalid_json_error(
+        self, openai_client: ApiLLMClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Invalid JSON twice raises LLMInvalidJSONError."""
+        field = make_field_spec("dob")
+        excerpts = [make_excerpt("doc_001", 1, "DOB: 1990-01-15")]
         run_options = RunOptions()
 
         call_count = 0
+        roles_seen: list[list[str]] = []
 
         def mock_call_api(messages: list, max_tokens: int) -> str:
             nonlocal call_count
             call_count += 1
-            return make_valid_json_response(
-                "555-123-4567", "15551234567", "doc_001", 1, "Phone: 555-123-4567"
-            )
+            roles_seen.append([m["role"] for m in messages])
+            return "still not valid json"
 
-        client._call_api = mock_call_api  # type: ignore
+        monkeypatch.setattr(openai_client, "_call_api", mock_call_api)
 
-        candidates = client.extract_candidates(field, excerpts, run_options=run_options)
+        with pytest.raises(LLMInvalidJSONError) as exc_info:
+            openai_client.extract_candidates(field, excerpts, run_options=run_options)
 
-        # Should have made exactly 1 call
-        assert call_count == 1
-        assert len(candidates) == 1
+        # Should have made exactly 2 calls (original + 1 retry)
+        assert call_count == 2
+        assert exc_info.value.field == "dob"
+        # The retry replays the bad reply followed by the stricter prompt
+        assert roles_seen == [["user"], ["user", "assistant", "user"]]
 
-    def test_empty_excerpts_returns_empty(self) -> None:
+    def test_empty_excerpts_returns_empty(
+        self, anthropic_client: ApiLLMClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Empty excerpts list returns empty candidates without API call."""
-        client = ApiLLMClient(
-            provider="anthropic",
-            api_key="fake-key",
-            model="test-model",
-        )
-
         field = make_field_spec("full_name")
         run_options = RunOptions()
 
@@ -299,9 +340,11 @@ class TestApiLLMClientRetry:
             call_count += 1
             return "[]"
 
-        client._call_api = mock_call_api  # type: ignore
+        monkeypatch.setattr(anthropic_client, "_call_api", mock_call_api)
 
-        candidates = client.extract_candidates(field, [], run_options=run_options)
+        candidates = anthropic_client.extract_candidates(
+            field, [], run_options=run_options
+        )
 
         assert candidates == []
         assert call_count == 0  # No API call made
@@ -321,16 +364,7 @@ class TestFakeLLMClient:
         excerpts = [make_excerpt("doc_001", 1, "text")]
         run_options = RunOptions()
 
-        candidate = Candidate(
-            field="full_name",
-            raw_value="Test",
-            normalized_value="test",
-            evidence=[Evidence(doc_id="doc_001", page=1, quoted_text="Test")],
-            from_method="llm",
-            scores=CandidateScores(anchor_match=1.0, validator=0.0, doc_relevance=0.0),
-        )
-
-        client.set_responses([[candidate]])
+        client.set_responses([[_CANDIDATE_TEMPLATE]])
 
         result = client.extract_candidates(field, excerpts, run_options=run_options)
 
@@ -369,6 +403,56 @@ class TestFakeLLMClient:
         assert calls[0][0].key == "full_name"
         assert calls[1][0].key == "dob"
 
+    def test_accepts_lazy_iterable(self) -> None:
+        """Responses may come from a generator and are consumed one per call."""
+        client = FakeLLMClient()
+
+        field = make_field_spec("full_name")
+        excerpts = [make_excerpt("doc_001", 1, "text")]
+        run_options = RunOptions()
+
+        error = LLMInvalidJSONError("full_name", "second response")
+        pulled: list[int] = []
+
+        def responses() -> Iterator[list[Candidate] | Exception]:
+            for index, response in enumerate([[_CANDIDATE_TEMPLATE], error]):
+                pulled.append(index)
+                yield response
+
+        client.set_responses(responses())
+        # Nothing is read ahead when the responses are set
+        assert pulled == []
+
+        result = client.extract_candidates(field, excerpts, run_options=run_options)
+        assert result == [_CANDIDATE_TEMPLATE]
+        assert pulled == [0]
+
+        with pytest.raises(LLMInvalidJSONError) as exc_info:
+            client.extract_candidates(field, excerpts, run_options=run_options)
+        assert exc_info.value is error
+        assert pulled == [0, 1]
+
+        # Exhausted: falls back to empty
+        assert client.extract_candidates(field, excerpts, run_options=run_options) == []
+        assert len(client.get_calls()) == 3
+
+    def test_reset_clears_calls_and_responses(self) -> None:
+        """reset() drops recorded calls and any unconsumed responses."""
+        client = FakeLLMClient()
+
+        field = make_field_spec("full_name")
+        excerpts = [make_excerpt("doc_001", 1, "text")]
+        run_options = RunOptions()
+
+        client.set_responses([[], LLMInvalidJSONError("full_name", "unused")])
+        client.extract_candidates(field, excerpts, run_options=run_options)
+
+        client.reset()
+
+        assert len(client.get_calls()) == 0
+        # The queued exception is gone, so the next call returns empty
+        assert client.extract_candidates(field, excerpts, run_options=run_options) == []
+
     def test_empty_responses_returns_empty(self) -> None:
         """No configured responses returns empty list."""
         client = FakeLLMClient()
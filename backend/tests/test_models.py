@@ -4,8 +4,14 @@ Unit tests for pydantic models.
 Tests model instantiation, validation rules, and invariant enforcement.
 """
 
+import functools
+import subprocess
+import sys
+import types
+from pathlib import Path
+
 import pytest
-from pydantic import ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from app.models import (
     SUPPORTED_FIELD_KEYS,
@@ -25,12 +31,91 @@ from app.models import (
 )
 
 
+# Directory containing the app package, for subprocess imports
+_BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+# The V1 field keys, exactly
+_EXPECTED_KEYS: frozenset[str] = frozenset({
+    "full_name",
+    "dob",
+    "phone",
+    "address",
+    "insurance_member_id",
+    "allergies",
+    "medications",
+})
+
+
+# --- Shared validators and instances ---
+
+
+@functools.cache
+def _adapter_for(model: type[BaseModel]) -> TypeAdapter:
+    """
+    One TypeAdapter per model, created on first request.
+
+    Lazy so collecting this module does not force every model's deferred
+    schema build; each adapter is then reused for the rest of the session.
+    """
+    return TypeAdapter(model)
+
+
+def make(model: type[BaseModel], **fields):
+    """Validate fields into a model instance through its cached adapter."""
+    return _adapter_for(model).validate_python(fields)
+
+
+# In-range required scores; tests overlay one out-of-range field with |
+_BASE_SCORES = types.MappingProxyType(
+    {"anchor_match": 0.5, "validator": 0.5, "doc_relevance": 0.5}
+)
+
+# Pre-encoded payloads for the construction tests (validated on the JSON path)
+_CANDIDATE_JSON = (
+    b'{"field":"full_name","raw_value":"John Doe","normalized_value":"John Doe",'
+    b'"evidence":[{"doc_id":"doc_001","page":1,"quoted_text":"John Doe"}],'
+    b'"from_method":"heuristic",'
+    b'"scores":{"anchor_match":1.0,"validator":1.0,"doc_relevance":0.8}}'
+)
+_BOUNDS_JSON = (
+    b'{"anchor_match":0.0,"validator":1.0,"doc_relevance":0.0,'
+    b'"cross_doc_agreement":1.0,"contradiction_penalty":1.0}'
+)
+_FINAL_RESULT_JSON = (
+    b'{"run_id":"2025-12-12T11-32-01Z_ab12cd","schema_source":"user_schema",'
+    b'"fields":{"full_name":{"field":"full_name","status":"filled",'
+    b'"value":"John Doe","normalized_value":"John Doe","confidence":0.95,'
+    b'"rationale":["Match found"]}}}'
+)
+
+# FinalField payload minus status, for the status literal tests
+_FINAL_FIELD_BASE = {"field": "full_name", "confidence": 0.5, "rationale": []}
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_evidence() -> Evidence:
+    """One validated Evidence shared by all tests (frozen model)."""
+    return make(Evidence, doc_id="doc_001", page=1, quoted_text="John Doe")
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_scores() -> CandidateScores:
+    """One validated CandidateScores shared by all tests (frozen model)."""
+    return make(CandidateScores, anchor_match=1.0, validator=1.0, doc_relevance=0.8)
+
+
+def _has_error(exc_info: pytest.ExceptionInfo[ValidationError], text: str) -> bool:
+    """Whether any structured error message contains text (no str() rendering)."""
+    return any(text in error["msg"] for error in exc_info.value.errors())
+
+
 class TestRunOptions:
     """Tests for RunOptions model."""
 
     def test_defaults(self):
         """Test that defaults are applied correctly."""
-        opts = RunOptions()
+        opts = make(RunOptions)
         assert opts.top_k_docs == 3
         assert opts.llm_provider == "anthropic"
         assert opts.llm_model == "claude-sonnet-4-20250514"
@@ -39,7 +124,8 @@ class TestRunOptions:
 
     def test_custom_values(self):
         """Test custom values are accepted."""
-        opts = RunOptions(
+        opts = make(
+            RunOptions,
             top_k_docs=5,
             llm_provider="openai",
             llm_model="gpt-4o-mini",
@@ -53,7 +139,7 @@ class TestRunOptions:
     def test_invalid_provider(self):
         """Test that invalid provider is rejected."""
         with pytest.raises(ValidationError):
-            RunOptions(llm_provider="invalid")
+            make(RunOptions, llm_provider="invalid")
 
 
 class TestFieldSpec:
@@ -61,36 +147,38 @@ class TestFieldSpec:
 
     def test_valid_field_spec(self):
         """Test valid field spec creation."""
-        spec = FieldSpec(key="full_name", label="Patient Name", type="string")
+        spec = make(FieldSpec, key="full_name", label="Patient Name", type="string")
         assert spec.key == "full_name"
         assert spec.label == "Patient Name"
         assert spec.type == "string"
 
-    def test_all_supported_keys(self):
+    @pytest.mark.parametrize(
+        ("key", "field_type"),
+        [
+            ("full_name", "string"),
+            ("dob", "date"),
+            ("phone", "phone"),
+            ("address", "string"),
+            ("insurance_member_id", "string"),
+            ("allergies", "string_or_list"),
+            ("medications", "string_or_list"),
+        ],
+    )
+    def test_all_supported_keys(self, key, field_type):
         """Test all supported keys are valid."""
-        types = {
-            "full_name": "string",
-            "dob": "date",
-            "phone": "phone",
-            "address": "string",
-            "insurance_member_id": "string",
-            "allergies": "string_or_list",
-            "medications": "string_or_list",
-        }
-        for key, field_type in types.items():
-            spec = FieldSpec(key=key, type=field_type)
-            assert spec.key == key
+        spec = make(FieldSpec, key=key, type=field_type)
+        assert spec.key == key
 
     def test_unsupported_key_rejected(self):
         """Test that unsupported field keys are rejected."""
         with pytest.raises(ValidationError) as exc_info:
-            FieldSpec(key="unknown_field", type="string")
-        assert "Unsupported field key" in str(exc_info.value)
+            make(FieldSpec, key="unknown_field", type="string")
+        assert _has_error(exc_info, "Unsupported field key")
 
     def test_invalid_type_rejected(self):
         """Test that invalid field types are rejected."""
         with pytest.raises(ValidationError):
-            FieldSpec(key="full_name", type="invalid_type")
+            make(FieldSpec, key="full_name", type="invalid_type")
 
 
 class TestResolvedSchema:
@@ -98,11 +186,12 @@ class TestResolvedSchema:
 
     def test_valid_schema(self):
         """Test valid schema creation."""
-        schema = ResolvedSchema(
+        schema = make(
+            ResolvedSchema,
             schema_source="user_schema",
             resolved_fields=[
-                FieldSpec(key="full_name", type="string"),
-                FieldSpec(key="dob", type="date"),
+                make(FieldSpec, key="full_name", type="string"),
+                make(FieldSpec, key="dob", type="date"),
             ],
         )
         assert schema.schema_source == "user_schema"
@@ -113,18 +202,19 @@ class TestResolvedSchema:
         """Test that schema_source only allows valid literals."""
         # Valid sources
         for source in ["user_schema", "fillable_pdf", "fallback_v1"]:
-            schema = ResolvedSchema(schema_source=source, resolved_fields=[])
+            schema = make(ResolvedSchema, schema_source=source, resolved_fields=[])
             assert schema.schema_source == source
 
         # Invalid source
         with pytest.raises(ValidationError):
-            ResolvedSchema(schema_source="invalid_source", resolved_fields=[])
+            make(ResolvedSchema, schema_source="invalid_source", resolved_fields=[])
 
     def test_unsupported_fields_tracking(self):
         """Test unsupported fields are tracked."""
-        schema = ResolvedSchema(
+        schema = make(
+            ResolvedSchema,
             schema_source="user_schema",
-            resolved_fields=[FieldSpec(key="full_name", type="string")],
+            resolved_fields=[make(FieldSpec, key="full_name", type="string")],
             unsupported_fields=["ssn", "email"],
         )
         assert schema.unsupported_fields == ["ssn", "email"]
@@ -135,7 +225,8 @@ class TestDocIndexItem:
 
     def test_valid_doc_index_item(self):
         """Test valid DocIndexItem creation."""
-        item = DocIndexItem(
+        item = make(
+            DocIndexItem,
             doc_id="doc_001",
             filename="medical_records.pdf",
             mime_type="application/pdf",
@@ -148,7 +239,8 @@ class TestDocIndexItem:
 
     def test_unreadable_document(self):
         """Test unreadable document with reason."""
-        item = DocIndexItem(
+        item = make(
+            DocIndexItem,
             doc_id="doc_002",
             filename="scanned.pdf",
             mime_type="application/pdf",
@@ -163,7 +255,8 @@ class TestDocIndexItem:
     def test_invalid_unreadable_reason(self):
         """Test invalid unreadable reason is rejected."""
         with pytest.raises(ValidationError):
-            DocIndexItem(
+            make(
+                DocIndexItem,
                 doc_id="doc_001",
                 filename="test.pdf",
                 mime_type="application/pdf",
@@ -178,37 +271,56 @@ class TestLayoutModels:
 
     def test_layout_span(self):
         """Test LayoutSpan creation."""
-        span = LayoutSpan(text="Patient Name: John Doe")
+        span = make(LayoutSpan, text="Patient Name: John Doe")
         assert span.text == "Patient Name: John Doe"
         assert span.bbox is None
 
-        span_with_bbox = LayoutSpan(text="test", bbox=[0.0, 0.0, 100.0, 20.0])
+        span_with_bbox = make(LayoutSpan, text="test", bbox=[0.0, 0.0, 100.0, 20.0])
         assert span_with_bbox.bbox == [0.0, 0.0, 100.0, 20.0]
 
     def test_layout_page_text_valid(self):
         """Test valid LayoutPageText creation."""
-        page = LayoutPageText(page=1, full_text="Page content here")
+        page = make(LayoutPageText, page=1, full_text="Page content here")
         assert page.page == 1
         assert page.spans == []
 
-    def test_layout_page_text_page_zero_rejected(self):
-        """Test that page=0 is rejected (pages are 1-indexed)."""
-        with pytest.raises(ValidationError) as exc_info:
-            LayoutPageText(page=0, full_text="content")
-        assert "Page must be >= 1" in str(exc_info.value)
+    def test_layout_page_text_lower_cached_not_serialized(self):
+        """Test that full_text_lower is cached and excluded from dumps/equality."""
+        page = make(LayoutPageText, page=1, full_text="Patient DOB")
+        other = make(LayoutPageText, page=1, full_text="Patient DOB")
+
+        assert page.full_text_lower == "patient dob"
+        assert page.full_text_lower is page.full_text_lower
+        assert "full_text_lower" not in page.model_dump()
+        assert page == other
+
+    def test_layout_page_text_lower_tracks_full_text(self):
+        """Test that full_text_lower never outlives a change to full_text."""
+        page = make(LayoutPageText, page=1, full_text="ABC")
+        assert page.full_text_lower == "abc"
 
-    def test_layout_page_text_negative_page_rejected(self):
-        """Test that negative page numbers are rejected."""
         with pytest.raises(ValidationError):
-            LayoutPageText(page=-1, full_text="content")
+            page.full_text = "XYZ"
+
+        assert page.model_copy(update={"full_text": "XYZ"}).full_text_lower == "xyz"
+        assert page.model_copy(update={"page": 2}).full_text_lower == "abc"
+
+    @pytest.mark.parametrize("page", [0, -1, -100])
+    def test_layout_page_text_nonpositive_page_rejected(self, page):
+        """Test that page numbers below 1 are rejected (pages are 1-indexed)."""
+        payload = {"page": page, "full_text": "content"}
+        with pytest.raises(ValidationError) as exc_info:
+            make(LayoutPageText, **payload)
+        assert _has_error(exc_info, "Page must be >= 1")
 
     def test_layout_doc(self):
         """Test LayoutDoc creation."""
-        doc = LayoutDoc(
+        doc = make(
+            LayoutDoc,
             doc_id="doc_001",
             pages=[
-                LayoutPageText(page=1, full_text="Page 1 content"),
-                LayoutPageText(page=2, full_text="Page 2 content"),
+                make(LayoutPageText, page=1, full_text="Page 1 content"),
+                make(LayoutPageText, page=2, full_text="Page 2 content"),
             ],
         )
         assert doc.doc_id == "doc_001"
@@ -220,7 +332,8 @@ class TestRoutingEntry:
 
     def test_valid_routing_entry(self):
         """Test valid RoutingEntry creation."""
-        entry = RoutingEntry(
+        entry = make(
+            RoutingEntry,
             field="full_name",
             doc_ids=["doc_001", "doc_002"],
             scores={"doc_001": 0.9, "doc_002": 0.7},
@@ -231,8 +344,8 @@ class TestRoutingEntry:
     def test_unsupported_field_rejected(self):
         """Test that unsupported field is rejected."""
         with pytest.raises(ValidationError) as exc_info:
-            RoutingEntry(field="unknown", doc_ids=[], scores={})
-        assert "Unsupported field key" in str(exc_info.value)
+            make(RoutingEntry, field="unknown", doc_ids=[], scores={})
+        assert _has_error(exc_info, "Unsupported field key")
 
 
 class TestEvidence:
@@ -240,7 +353,8 @@ class TestEvidence:
 
     def test_valid_evidence(self):
         """Test valid Evidence creation."""
-        evidence = Evidence(
+        evidence = make(
+            Evidence,
             doc_id="doc_001",
             page=1,
             quoted_text="Patient Name: John Doe",
@@ -251,7 +365,8 @@ class TestEvidence:
 
     def test_evidence_with_bbox(self):
         """Test Evidence with bounding box."""
-        evidence = Evidence(
+        evidence = make(
+            Evidence,
             doc_id="doc_001",
             page=1,
             quoted_text="DOB: 1990-01-15",
@@ -262,37 +377,42 @@ class TestEvidence:
     def test_empty_doc_id_rejected(self):
         """Test that empty doc_id is rejected."""
         with pytest.raises(ValidationError) as exc_info:
-            Evidence(doc_id="", page=1, quoted_text="text")
-        assert "doc_id must not be empty" in str(exc_info.value)
+            make(Evidence, doc_id="", page=1, quoted_text="text")
+        assert _has_error(exc_info, "doc_id must not be empty")
 
     def test_whitespace_doc_id_rejected(self):
         """Test that whitespace-only doc_id is rejected."""
         with pytest.raises(ValidationError) as exc_info:
-            Evidence(doc_id="   ", page=1, quoted_text="text")
-        assert "doc_id must not be empty" in str(exc_info.value)
+            make(Evidence, doc_id="   ", page=1, quoted_text="text")
+        assert _has_error(exc_info, "doc_id must not be empty")
 
     def test_page_zero_rejected(self):
         """Test that page=0 is rejected."""
         with pytest.raises(ValidationError) as exc_info:
-            Evidence(doc_id="doc_001", page=0, quoted_text="text")
-        assert "Page must be >= 1" in str(exc_info.value)
+            make(Evidence, doc_id="doc_001", page=0, quoted_text="text")
+        assert _has_error(exc_info, "Page must be >= 1")
 
     def test_negative_page_rejected(self):
         """Test that negative page is rejected."""
         with pytest.raises(ValidationError):
-            Evidence(doc_id="doc_001", page=-1, quoted_text="text")
+            make(Evidence, doc_id="doc_001", page=-1, quoted_text="text")
 
     def test_empty_quoted_text_rejected(self):
         """Test that empty quoted_text is rejected."""
         with pytest.raises(ValidationError) as exc_info:
-            Evidence(doc_id="doc_001", page=1, quoted_text="")
-        assert "quoted_text must not be empty" in str(exc_info.value)
+            make(Evidence, doc_id="doc_001", page=1, quoted_text="")
+        assert _has_error(exc_info, "quoted_text must not be empty")
 
     def test_whitespace_quoted_text_rejected(self):
         """Test that whitespace-only quoted_text is rejected."""
         with pytest.raises(ValidationError) as exc_info:
-            Evidence(doc_id="doc_001", page=1, quoted_text="   \n\t  ")
-        assert "quoted_text must not be empty" in str(exc_info.value)
+            make(Evidence, doc_id="doc_001", page=1, quoted_text="   \n\t  ")
+        assert _has_error(exc_info, "quoted_text must not be empty")
+
+    def test_is_frozen(self):
+        """Test that Evidence rejects attribute assignment (safe to share)."""
+        with pytest.raises(ValidationError):
+            _cached_evidence().page = 2
 
 
 class TestCandidateScores:
@@ -300,7 +420,8 @@ class TestCandidateScores:
 
     def test_valid_scores(self):
         """Test valid score creation."""
-        scores = CandidateScores(
+        scores = make(
+            CandidateScores,
             anchor_match=1.0,
             validator=0.8,
             doc_relevance=0.5,
@@ -311,142 +432,145 @@ class TestCandidateScores:
 
     def test_all_scores_at_bounds(self):
         """Test scores at boundary values."""
-        scores = CandidateScores(
-            anchor_match=0.0,
-            validator=1.0,
-            doc_relevance=0.0,
-            cross_doc_agreement=1.0,
-            contradiction_penalty=1.0,
-        )
+        scores = CandidateScores.model_validate_json(_BOUNDS_JSON)
         assert scores.anchor_match == 0.0
+        assert scores.validator == 1.0
+        assert scores.doc_relevance == 0.0
+        assert scores.cross_doc_agreement == 1.0
         assert scores.contradiction_penalty == 1.0
 
     def test_score_below_zero_rejected(self):
         """Test that scores below 0 are rejected."""
         with pytest.raises(ValidationError) as exc_info:
-            CandidateScores(anchor_match=-0.1, validator=0.5, doc_relevance=0.5)
-        assert "must be in [0, 1]" in str(exc_info.value)
+            make(CandidateScores, anchor_match=-0.1, validator=0.5, doc_relevance=0.5)
+        assert _has_error(exc_info, "must be in [0, 1]")
 
     def test_score_above_one_rejected(self):
         """Test that scores above 1 are rejected."""
         with pytest.raises(ValidationError) as exc_info:
-            CandidateScores(anchor_match=0.5, validator=1.1, doc_relevance=0.5)
-        assert "must be in [0, 1]" in str(exc_info.value)
+            make(CandidateScores, anchor_match=0.5, validator=1.1, doc_relevance=0.5)
+        assert _has_error(exc_info, "must be in [0, 1]")
 
-    def test_all_score_fields_validated(self):
-        """Test that all score fields have range validation."""
-        score_fields = [
+    @pytest.mark.parametrize(
+        "field",
+        [
             "anchor_match",
             "validator",
             "doc_relevance",
             "cross_doc_agreement",
             "contradiction_penalty",
-        ]
-        for field in score_fields:
-            with pytest.raises(ValidationError):
-                kwargs = {
-                    "anchor_match": 0.5,
-                    "validator": 0.5,
-                    "doc_relevance": 0.5,
-                }
-                kwargs[field] = 1.5  # Out of range
-                CandidateScores(**kwargs)
+        ],
+    )
+    def test_all_score_fields_validated(self, field):
+        """Test that all score fields have range validation."""
+        make(CandidateScores, **_BASE_SCORES)  # The base alone is valid
+        with pytest.raises(ValidationError):
+            make(CandidateScores, **(_BASE_SCORES | {field: 1.5}))  # Out of range
+
+    def test_is_frozen(self):
+        """Test that CandidateScores rejects attribute assignment (safe to share)."""
+        with pytest.raises(ValidationError):
+            _cached_scores().validator = 0.0
 
 
 class TestCandidate:
     """Tests for Candidate model."""
 
-    def _make_evidence(self) -> Evidence:
-        return Evidence(doc_id="doc_001", page=1, quoted_text="John Doe")
-
-    def _make_scores(self) -> CandidateScores:
-        return CandidateScores(anchor_match=1.0, validator=1.0, doc_relevance=0.8)
-
     def test_valid_candidate(self):
         """Test valid Candidate creation."""
-        candidate = Candidate(
-            field="full_name",
-            raw_value="John Doe",
-            normalized_value="John Doe",
-            evidence=[self._make_evidence()],
-            from_method="heuristic",
-            scores=self._make_scores(),
-        )
+        candidate = Candidate.model_validate_json(_CANDIDATE_JSON)
         assert candidate.field == "full_name"
+        assert candidate.evidence == [_cached_evidence()]
+        assert candidate.scores == _cached_scores()
         assert candidate.is_accepted is True
 
+    def test_malformed_json_rejected(self):
+        """Test that truncated JSON is rejected."""
+        with pytest.raises(ValidationError):
+            Candidate.model_validate_json(_CANDIDATE_JSON[:-1])
+
     def test_candidate_with_rejection(self):
         """Test candidate with rejection reasons."""
-        candidate = Candidate(
+        candidate = make(
+            Candidate,
             field="full_name",
             raw_value="John Doe",
             normalized_value="John Doe",
-            evidence=[self._make_evidence()],
+            evidence=[_cached_evidence()],
             from_method="llm",
             rejected_reasons=["unsupported_by_evidence"],
-            scores=self._make_scores(),
+            scores=_cached_scores(),
         )
         assert candidate.is_accepted is False
 
     def test_empty_evidence_rejected(self):
         """Test that empty evidence list is rejected."""
         with pytest.raises(ValidationError) as exc_info:
-            Candidate(
+            make(
+                Candidate,
                 field="full_name",
                 raw_value="John Doe",
                 normalized_value="John Doe",
                 evidence=[],
                 from_method="heuristic",
-                scores=self._make_scores(),
+                scores=_cached_scores(),
             )
-        assert "evidence must not be empty" in str(exc_info.value)
+        assert _has_error(exc_info, "evidence must not be empty")
 
     def test_unsupported_field_rejected(self):
         """Test that unsupported field is rejected."""
         with pytest.raises(ValidationError) as exc_info:
-            Candidate(
+            make(
+                Candidate,
                 field="ssn",
                 raw_value="123-45-6789",
                 normalized_value="123456789",
-                evidence=[self._make_evidence()],
+                evidence=[_cached_evidence()],
                 from_method="heuristic",
-                scores=self._make_scores(),
+                scores=_cached_scores(),
             )
-        assert "Unsupported field key" in str(exc_info.value)
+        assert _has_error(exc_info, "Unsupported field key")
 
     def test_invalid_from_method_rejected(self):
         """Test that invalid from_method is rejected."""
         with pytest.raises(ValidationError):
-            Candidate(
+            make(
+                Candidate,
                 field="full_name",
                 raw_value="John",
                 normalized_value="John",
-                evidence=[self._make_evidence()],
+                evidence=[_cached_evidence()],
                 from_method="regex",  # Invalid
-                scores=self._make_scores(),
+                scores=_cached_scores(),
             )
 
 
 class TestFinalField:
-    """Tests for FinalField model."""
+    """
+    Tests for FinalField model.
+
+    The filled/missing/needs_review shape tests use model_construct: they
+    check the attributes a pipeline stage sets, while the status and
+    confidence validators are covered by their own tests below.
+    """
 
     def test_filled_field(self):
         """Test filled field creation."""
-        field = FinalField(
+        field = FinalField.model_construct(
             field="full_name",
             status="filled",
             value="John Doe",
             normalized_value="John Doe",
             confidence=0.95,
             rationale=["High anchor match", "Validator passed"],
-            evidence=[Evidence(doc_id="doc_001", page=1, quoted_text="John Doe")],
+            evidence=[_cached_evidence()],
         )
         assert field.status == "filled"
         assert field.confidence == 0.95
 
     def test_missing_field(self):
         """Test missing field creation."""
-        field = FinalField(
+        field = FinalField.model_construct(
             field="insurance_member_id",
             status="missing",
             value=None,
@@ -459,7 +583,7 @@ class TestFinalField:
 
     def test_needs_review_field(self):
         """Test needs_review field creation."""
-        field = FinalField(
+        field = FinalField.model_construct(
             field="dob",
             status="needs_review",
             value="1990-01-15",
@@ -472,32 +596,48 @@ class TestFinalField:
     def test_invalid_status_rejected(self):
         """Test that invalid status is rejected."""
         with pytest.raises(ValidationError):
-            FinalField(
+            make(
+                FinalField,
                 field="full_name",
                 status="approved",  # Invalid
                 confidence=0.8,
                 rationale=[],
             )
 
-    def test_status_enum_validation(self):
-        """Test that only valid status literals are accepted."""
-        valid_statuses = ["filled", "needs_review", "missing"]
-        for status in valid_statuses:
-            field = FinalField(field="full_name", status=status, confidence=0.5, rationale=[])
-            assert field.status == status
-
-        invalid_statuses = ["done", "pending", "error", "complete"]
-        for status in invalid_statuses:
-            with pytest.raises(ValidationError):
-                FinalField(field="full_name", status=status, confidence=0.5, rationale=[])
+    @pytest.mark.parametrize("status", ["filled", "needs_review", "missing"])
+    def test_status_enum_validation(self, status):
+        """Test that each valid status literal is accepted."""
+        payload = {**_FINAL_FIELD_BASE, "status": status}
+        field = make(FinalField, **payload)
+        assert field.status == status
+
+    # One unrelated word and one case variant of a valid literal
+    @pytest.mark.parametrize("status", ["done", "Filled"])
+    def test_status_enum_rejects_unknown(self, status):
+        """Test that statuses outside the literal set are rejected."""
+        payload = {**_FINAL_FIELD_BASE, "status": status}
+        with pytest.raises(ValidationError):
+            make(FinalField, **payload)
 
     def test_confidence_range_validation(self):
         """Test confidence must be in [0, 1]."""
         with pytest.raises(ValidationError):
-            FinalField(field="full_name", status="filled", confidence=1.5, rationale=[])
+            make(
+                FinalField,
+                field="full_name",
+                status="filled",
+                confidence=1.5,
+                rationale=[],
+            )
 
         with pytest.raises(ValidationError):
-            FinalField(field="full_name", status="filled", confidence=-0.1, rationale=[])
+            make(
+                FinalField,
+                field="full_name",
+                status="filled",
+                confidence=-0.1,
+                rationale=[],
+            )
 
 
 class TestFinalResult:
@@ -505,36 +645,30 @@ class TestFinalResult:
 
     def test_valid_final_result(self):
         """Test valid FinalResult creation."""
-        result = FinalResult(
-            run_id="2025-12-12T11-32-01Z_ab12cd",
-            schema_source="user_schema",
-            fields={
-                "full_name": FinalField(
-                    field="full_name",
-                    status="filled",
-                    value="John Doe",
-                    normalized_value="John Doe",
-                    confidence=0.95,
-                    rationale=["Match found"],
-                )
-            },
-        )
+        result = FinalResult.model_validate_json(_FINAL_RESULT_JSON)
         assert result.run_id == "2025-12-12T11-32-01Z_ab12cd"
         assert "full_name" in result.fields
+        assert result.fields["full_name"].confidence == 0.95
+
+    def test_malformed_json_rejected(self):
+        """Test that non-JSON input is rejected."""
+        with pytest.raises(ValidationError):
+            FinalResult.model_validate_json(b"{run_id: test}")
 
     def test_schema_source_literal_validation(self):
         """Test FinalResult.schema_source only allows valid literals."""
         valid_sources = ["user_schema", "fillable_pdf", "fallback_v1"]
         for source in valid_sources:
-            result = FinalResult(run_id="test", schema_source=source, fields={})
+            result = make(FinalResult, run_id="test", schema_source=source, fields={})
             assert result.schema_source == source
 
         with pytest.raises(ValidationError):
-            FinalResult(run_id="test", schema_source="invalid", fields={})
+            make(FinalResult, run_id="test", schema_source="invalid", fields={})
 
     def test_empty_fields(self):
         """Test FinalResult with no fields (all missing scenario)."""
-        result = FinalResult(
+        result = make(
+            FinalResult,
             run_id="test_run",
             schema_source="fallback_v1",
             fields={},
@@ -547,17 +681,44 @@ class TestSupportedFieldKeys:
 
     def test_all_expected_keys_present(self):
         """Test that all expected keys are in the set."""
-        expected = {
-            "full_name",
-            "dob",
-            "phone",
-            "address",
-            "insurance_member_id",
-            "allergies",
-            "medications",
-        }
-        assert SUPPORTED_FIELD_KEYS == expected
+        assert SUPPORTED_FIELD_KEYS == _EXPECTED_KEYS
 
     def test_key_count(self):
         """Test the number of supported keys."""
         assert len(SUPPORTED_FIELD_KEYS) == 7
+
+    def test_is_immutable(self):
+        """Test that the supported key set cannot be mutated at runtime."""
+        assert isinstance(SUPPORTED_FIELD_KEYS, frozenset)
+
+
+class TestModelConfig:
+    """Tests for the shared model configuration."""
+
+    def test_models_defer_schema_build(self):
+        """Test every model opts into defer_build."""
+        for model in (
+            RunOptions, FieldSpec, ResolvedSchema, DocIndexItem, LayoutSpan,
+            LayoutPageText, LayoutDoc, RoutingEntry, Evidence, CandidateScores,
+            Candidate, FinalField, FinalResult,
+        ):
+            assert model.model_config.get("defer_build") is True, model.__name__
+
+    def test_fresh_import_builds_nothing(self):
+        """Test importing app.models compiles no validators until first use."""
+        code = (
+            "import app.models as m\n"
+            "assert not m.FinalResult.__pydantic_complete__\n"
+            "m.FieldSpec(key='dob', type='date')\n"
+            "assert m.FieldSpec.__pydantic_complete__\n"
+            "assert not m.FinalResult.__pydantic_complete__\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=_BACKEND_DIR)
+
+    def test_error_messages_hide_input(self):
+        """Test that rendered errors omit the input; errors() keeps it."""
+        # The constructor, not make(): a TypeAdapter applies its own config
+        with pytest.raises(ValidationError) as exc_info:
+            LayoutPageText(page=1, full_text=["Patient SSN 123-45-6789"])
+        assert "123-45-6789" not in str(exc_info.value)
+        assert exc_info.value.errors()[0]["input"] == ["Patient SSN 123-45-6789"]
@@ -4,16 +4,39 @@ Unit tests for pdf_text module.
 Tests native PDF text extraction using pypdf.
 """
 
+import io
 from pathlib import Path
 
 import pytest
 
-from app.pdf_text import extract_text_per_page, is_pdf
+from app.pdf_text import extract_text_per_page, is_pdf, is_pdf_bytes
 
 
 # Path to test fixtures
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
+# File opens + pypdf parsing throughout; shard apart from CPU-bound tests
+pytestmark = pytest.mark.io
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _ensure_fixtures() -> None:
+    """Fail fast, once, if any fixture PDF is missing."""
+    missing = [
+        name
+        for name in ("blank.pdf", "sample_text.pdf", "two_pages.pdf")
+        if not (FIXTURES_DIR / name).exists()
+    ]
+    assert not missing, f"fixture PDFs missing: {missing}"
+
+
+@pytest.fixture(scope="session")
+def invalid_pdf_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A .pdf file holding non-PDF bytes, written once per session."""
+    path = tmp_path_factory.mktemp("bad_pdf") / "invalid.pdf"
+    path.write_bytes(b"not a valid pdf")
+    return path
+
 
 class TestExtractTextPerPage:
     """Tests for PDF text extraction."""
@@ -21,22 +44,17 @@ class TestExtractTextPerPage:
     def test_blank_pdf_has_no_text_layer(self) -> None:
         """Test that a blank PDF is detected as having no text layer."""
         blank_pdf = FIXTURES_DIR / "blank.pdf"
-        assert blank_pdf.exists(), "blank.pdf fixture missing"
-
         result = extract_text_per_page(blank_pdf)
 
         assert result.has_text_layer is False
         assert result.page_count == 1
         # All pages should be empty/whitespace
-        assert all(not page.strip() for page in result.pages)
+        assert not "".join(result.pages).strip()
         assert result.error is None
 
-    def test_text_pdf_has_text_layer(self) -> None:
+    def test_text_pdf_has_text_layer(self, sample_text_bytes: bytes) -> None:
         """Test that a PDF with text is detected correctly."""
-        text_pdf = FIXTURES_DIR / "sample_text.pdf"
-        assert text_pdf.exists(), "sample_text.pdf fixture missing"
-
-        result = extract_text_per_page(text_pdf)
+        result = extract_text_per_page(io.BytesIO(sample_text_bytes))
 
         assert result.has_text_layer is True
         assert result.page_count == 1
@@ -47,8 +65,6 @@ class TestExtractTextPerPage:
     def test_two_page_pdf_extracts_both_pages(self) -> None:
         """Test that multi-page PDFs have all pages extracted."""
         two_page_pdf = FIXTURES_DIR / "two_pages.pdf"
-        assert two_page_pdf.exists(), "two_pages.pdf fixture missing"
-
         result = extract_text_per_page(two_page_pdf)
 
         assert result.has_text_layer is True
@@ -58,12 +74,9 @@ class TestExtractTextPerPage:
         assert "Page One" in result.pages[0]
         assert "Page Two" in result.pages[1]
 
-    def test_invalid_pdf_returns_parse_error(self, tmp_path: Path) -> None:
+    def test_invalid_pdf_returns_parse_error(self, invalid_pdf_path: Path) -> None:
         """Test that invalid PDF data returns error result."""
-        invalid_pdf = tmp_path / "invalid.pdf"
-        invalid_pdf.write_bytes(b"not a valid pdf")
-
-        result = extract_text_per_page(invalid_pdf)
+        result = extract_text_per_page(invalid_pdf_path)
 
         assert result.has_text_layer is False
         assert result.page_count == 0
@@ -80,25 +93,40 @@ class TestExtractTextPerPage:
         assert result.has_text_layer is False
         assert result.error is not None
 
-    def test_extraction_is_deterministic(self) -> None:
+    def test_extraction_is_deterministic(self, sample_text_bytes: bytes) -> None:
         """Test that text extraction is deterministic."""
-        text_pdf = FIXTURES_DIR / "sample_text.pdf"
-
-        result1 = extract_text_per_page(text_pdf)
-        result2 = extract_text_per_page(text_pdf)
+        # Parse twice from the session's in-memory copy; no disk reads
+        result1 = extract_text_per_page(io.BytesIO(sample_text_bytes))
+        result2 = extract_text_per_page(io.BytesIO(sample_text_bytes))
 
         assert result1.pages == result2.pages
         assert result1.has_text_layer == result2.has_text_layer
         assert result1.page_count == result2.page_count
 
+    def test_stream_matches_path(self, two_pages_bytes: bytes) -> None:
+        """Test that a binary stream extracts the same as the file path."""
+        from_path = extract_text_per_page(FIXTURES_DIR / "two_pages.pdf")
+        from_stream = extract_text_per_page(io.BytesIO(two_pages_bytes))
+
+        assert from_stream == from_path
+
 
 class TestIsPdf:
     """Tests for PDF detection."""
 
     def test_detects_valid_pdf(self) -> None:
-        """Test that valid PDF is detected."""
-        pdf_file = FIXTURES_DIR / "sample_text.pdf"
-        assert is_pdf(pdf_file) is True
+        """Test that valid PDF files are detected."""
+        assert is_pdf(FIXTURES_DIR / "sample_text.pdf") is True
+
+    def test_detects_valid_pdf_bytes(self, sample_text_bytes: bytes) -> None:
+        """Test that valid PDF content is detected."""
+        assert is_pdf_bytes(sample_text_bytes) is True
+
+    def test_rejects_non_pdf_bytes(self) -> None:
+        """Test that non-PDF content and short headers are rejected."""
+        assert is_pdf_bytes(b"plain text content") is False
+        assert is_pdf_bytes(b"%PD") is False
+        assert is_pdf_bytes(b"") is False
 
     def test_rejects_non_pdf(self, tmp_path: Path) -> None:
         """Test that non-PDF files are rejected."""
@@ -6,6 +6,7 @@ without depending on PDF libraries.
 """
 
 import json
+import sys
 from pathlib import Path
 
 import pytest
@@ -20,8 +21,10 @@ from app.models import (
 )
 from app.routing import (
     N_CHARS,
+    _routing_to_dicts,
     route_docs,
     score_query_doc,
+    score_query_tokens,
     tokenize,
     write_routing_artifact,
 )
@@ -128,6 +131,19 @@ class TestTokenize:
         # é is non-alphanumeric (not a-z, 0-9), so it becomes space
         assert result == {"hello", "world"}
 
+    def test_non_ascii_lowercase_and_punctuation(self) -> None:
+        """Test that ASCII punctuation and case-folded non-ASCII split tokens."""
+        # "\u00c9" lowercases to "\u00e9", still outside a-z
+        result = tokenize("Caf\u00c9-Bar? ab\u2014cd [x] \U0001f600ok")
+        assert result == {"caf", "bar", "ab", "cd", "ok"}
+
+    def test_returns_interned_frozenset(self) -> None:
+        """Test that tokens come back as a frozenset of interned strings."""
+        result = tokenize("".join(["pati", "ent"]) + " name")
+        assert isinstance(result, frozenset)
+        for token in result:
+            assert token is sys.intern(token)
+
 
 class TestScoreQueryDoc:
     """Tests for the score_query_doc function."""
@@ -182,6 +198,27 @@ class TestScoreQueryDoc:
         assert score == 0.0
 
 
+class TestScoreQueryTokens:
+    """Tests for the score_query_tokens function."""
+
+    def test_matches_score_query_doc(self) -> None:
+        """Test that pre-tokenized scoring matches string scoring."""
+        cases = [
+            ("hello world", "hello friend"),
+            ("test query", "this is a test document"),
+            ("", "some document text"),
+            ("apple banana", "cat dog elephant"),
+        ]
+        for query, doc_text in cases:
+            expected = score_query_doc(query, doc_text)
+            actual = score_query_tokens(tokenize(query), tokenize(doc_text))
+            assert actual == expected
+
+    def test_empty_query_tokens(self) -> None:
+        """Test that an empty query token set scores 0.0."""
+        assert score_query_tokens(set(), {"hello"}) == 0.0
+
+
 class TestRouteDocsUnreadableExcluded:
     """Tests that unreadable docs are excluded from routing."""
 
@@ -457,6 +494,79 @@ class TestRouteDocsScoreValues:
         assert entry.doc_ids == ["doc_no_match"]
         assert entry.scores["doc_no_match"] == 0.0
 
+    def test_doc_without_layout_scores_zero(self) -> None:
+        """Test that a readable doc missing from layout is routed with 0.0."""
+        schema = make_resolved_schema([make_field_spec("phone")])
+        docs = [make_doc_index_item("doc_1"), make_doc_index_item("doc_2")]
+        layout = [make_layout_doc("doc_2", ["phone mobile"])]
+
+        result = route_docs(schema, docs, layout, top_k=2)
+
+        assert result[0].doc_ids == ["doc_2", "doc_1"]
+        assert result[0].scores["doc_1"] == 0.0
+
+    def test_empty_query_ranks_by_doc_id(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a field with no query tokens scores 0.0 in doc_id order."""
+        import app.routing as routing
+
+        # Every supported key yields tokens; force the degenerate case
+        monkeypatch.setattr(
+            routing, "_field_query_tokens", lambda key, label: frozenset()
+        )
+
+        schema = make_resolved_schema([make_field_spec("dob")])
+        docs = [make_doc_index_item("doc_b"), make_doc_index_item("doc_a")]
+        layout = [
+            make_layout_doc("doc_b", ["dob date of birth"]),
+            make_layout_doc("doc_a", ["anything"]),
+        ]
+
+        result = route_docs(schema, docs, layout, top_k=1)
+
+        assert result[0].doc_ids == ["doc_a"]
+        assert result[0].scores == {"doc_a": 0.0}
+
+    def test_each_doc_tokenized_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that docs are tokenized once, not once per field."""
+        import app.routing as routing
+
+        calls: list[str] = []
+        real_tokenize = routing.tokenize
+
+        def counting_tokenize(text: str) -> frozenset[str]:
+            calls.append(text)
+            return real_tokenize(text)
+
+        monkeypatch.setattr(routing, "tokenize", counting_tokenize)
+        # Field queries are memoized; start cold so each is tokenized here
+        routing._field_query_tokens.cache_clear()
+
+        schema = make_resolved_schema([
+            make_field_spec("full_name"),
+            make_field_spec("dob"),
+            make_field_spec("phone"),
+        ])
+        docs = [make_doc_index_item("doc_1"), make_doc_index_item("doc_2")]
+        layout = [
+            make_layout_doc("doc_1", ["patient name john"]),
+            make_layout_doc("doc_2", ["date of birth"]),
+        ]
+
+        route_docs(schema, docs, layout, top_k=2)
+
+        # One call per doc plus one per field query
+        assert len(calls) == 2 + 3
+
+        # No readable docs: nothing to score, so no query is tokenized
+        calls.clear()
+        route_docs(schema, [], [], top_k=2)
+        assert calls == []
+
+        # Routing the same schema again reuses the memoized query tokens
+        calls.clear()
+        route_docs(schema, docs, layout, top_k=2)
+        assert len(calls) == 2
+
 
 class TestWriteRoutingArtifact:
     """Tests for write_routing_artifact function."""
@@ -503,6 +613,25 @@ class TestWriteRoutingArtifact:
             entry = RoutingEntry.model_validate(item)
             assert entry.field == "allergies"
 
+    def test_payload_matches_model_dump(self, tmp_path: Path) -> None:
+        """Test that the hand-built payload equals pydantic's model_dump."""
+        run = create_run(run_id="test-payload", base_dir=tmp_path)
+
+        routing = [
+            RoutingEntry(
+                field="phone",
+                doc_ids=["doc_1", "doc_2"],
+                scores={"doc_1": 0.5, "doc_2": 0.25},
+            ),
+            RoutingEntry(field="dob", doc_ids=[], scores={}),
+        ]
+
+        expected = [entry.model_dump() for entry in routing]
+        assert _routing_to_dicts(routing) == expected
+
+        write_routing_artifact(run, routing)
+        assert read_json(run.artifact_path("routing.json")) == expected
+
 
 class TestRouteDocsIntegration:
     """Integration tests for route_docs with realistic scenarios."""
@@ -592,3 +721,17 @@ class TestRouteDocsIntegration:
         # (We're testing the cap is applied - exact score depends on tokenization)
         assert entry.doc_ids == ["huge_doc"]
 
+    def test_n_chars_cap_spans_pages(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the cap cuts mid-page and drops later pages entirely."""
+        import app.routing as routing
+
+        monkeypatch.setattr(routing, "N_CHARS", 10)
+        # Pages given out of order; text is assembled by page number
+        layout_doc = LayoutDoc(doc_id="doc_1", pages=[
+            LayoutPageText(page=3, full_text="cccc"),
+            LayoutPageText(page=1, full_text="aaaaaa"),
+            LayoutPageText(page=2, full_text="bbbbbb"),
+        ])
+
+        assert routing._build_doc_text(layout_doc) == "aaaaaabbbb"
+
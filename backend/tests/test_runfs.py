@@ -5,10 +5,14 @@ Tests atomic JSON writes, run directory creation, and idempotent input copying.
 """
 
 import json
+import os
+import shutil
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
 
+from app import runfs
 from app.runfs import (
     RunPaths,
     _generate_run_id,
@@ -104,6 +108,65 @@ class TestWriteJsonAtomic:
 
         assert result == data
 
+    def test_matches_stdlib_json_formatting(self, tmp_path: Path) -> None:
+        """Test that output is byte-identical to the stdlib json formatting."""
+        target = tmp_path / "stdlib.json"
+        data = {
+            "z": [{"b": 0.45, "a": "Café \"quoted\"\n"}, [], {}],
+            "a": {"nested": [1, None, True]},
+            "ints": {"1": 1},
+        }
+
+        write_json_atomic(target, data)
+
+        expected = json.dumps(data, ensure_ascii=False, sort_keys=True, indent=2)
+        assert target.read_text(encoding="utf-8") == expected
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_non_finite_floats_match_stdlib(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+    ) -> None:
+        """Test that NaN/inf are written as json does, with or without orjson."""
+        if not use_orjson:
+            monkeypatch.setattr(runfs, "orjson", None)
+        target = tmp_path / "nonfinite.json"
+        data = {
+            "scores": [{"s": float("nan")}, {"s": 0.5}],
+            "bounds": (float("inf"), float("-inf")),
+            "missing": None,
+        }
+
+        write_json_atomic(target, data)
+
+        expected = json.dumps(data, ensure_ascii=False, sort_keys=True, indent=2)
+        assert target.read_text(encoding="utf-8") == expected
+        assert read_json(target)["bounds"] == [float("inf"), float("-inf")]
+
+    def test_non_str_keys_and_unserializable_values(self, tmp_path: Path) -> None:
+        """Test that json's key coercion and TypeError behaviour are preserved."""
+        target = tmp_path / "keys.json"
+
+        write_json_atomic(target, {1: "one", 2: "two"})
+        assert read_json(target) == {"1": "one", "2": "two"}
+
+        with pytest.raises(TypeError):
+            write_json_atomic(tmp_path / "bad.json", {"when": datetime.now(timezone.utc)})
+
+    def test_durable_fsyncs_file_and_directory(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that durable writes fsync the file and its directory, and opt out."""
+        calls: list[int] = []
+        monkeypatch.setattr(os, "fsync", calls.append)
+
+        write_json_atomic(tmp_path / "durable.json", {"a": 1})
+        assert len(calls) == (2 if os.name == "posix" else 1)
+
+        calls.clear()
+        write_json_atomic(tmp_path / "scratch.json", {"a": 1}, durable=False)
+        assert calls == []
+        assert read_json(tmp_path / "scratch.json") == {"a": 1}
+
 
 class TestReadJson:
     """Tests for JSON reading functionality."""
@@ -129,6 +192,25 @@ class TestReadJson:
         with pytest.raises(json.JSONDecodeError):
             read_json(target)
 
+    def test_read_matches_stdlib_for_nonstandard_input(self, tmp_path: Path) -> None:
+        """Test that input orjson rejects still parses the way json does."""
+        target = tmp_path / "nonstandard.json"
+        text = '{"big": 123456789012345678901234567890, "nan": NaN}'
+        target.write_text(text, encoding="utf-8")
+
+        result = read_json(target)
+
+        assert result["big"] == 123456789012345678901234567890
+        assert result["nan"] != result["nan"]
+
+    def test_read_invalid_utf8_raises(self, tmp_path: Path) -> None:
+        """Test that bytes that are not UTF-8 raise UnicodeDecodeError."""
+        target = tmp_path / "latin1.json"
+        target.write_bytes(b'{"name": "caf\xe9"}')
+
+        with pytest.raises(UnicodeDecodeError):
+            read_json(target)
+
 
 class TestCreateRun:
     """Tests for run directory creation."""
@@ -237,6 +319,58 @@ class TestCopyInputsOnce:
         assert (run.input_docs_dir() / "doc1.pdf").read_bytes() == b"PDF content 1"
         assert (run.input_docs_dir() / "doc2.pdf").read_bytes() == b"PDF content 2"
 
+    def test_copies_path_inputs(self, tmp_path: Path) -> None:
+        """Test that Path contents are copied from disk, mixed with bytes."""
+        run = create_run(run_id="test-copy-path", base_dir=tmp_path)
+        source = tmp_path / "upload.pdf"
+        source.write_bytes(b"PDF on disk")
+
+        copy_inputs_once(
+            run,
+            request_json={},
+            target_files=[("target.pdf", source)],
+            input_files=[("doc1.pdf", source), ("doc2.pdf", b"PDF content 2")],
+        )
+
+        assert (run.target_docs_dir() / "target.pdf").read_bytes() == b"PDF on disk"
+        assert (run.input_docs_dir() / "doc1.pdf").read_bytes() == b"PDF on disk"
+        assert (run.input_docs_dir() / "doc2.pdf").read_bytes() == b"PDF content 2"
+
+        # A second copy from a changed source leaves the existing file alone
+        source.write_bytes(b"changed")
+        copy_inputs_once(run, request_json={}, input_files=[("doc1.pdf", source)])
+        assert (run.input_docs_dir() / "doc1.pdf").read_bytes() == b"PDF on disk"
+
+    def test_failed_copy_is_retried(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a failed copy leaves no file behind, so a retry completes."""
+        run = create_run(run_id="test-copy-retry", base_dir=tmp_path)
+        dest = run.input_docs_dir() / "doc.pdf"
+        source = tmp_path / "upload.pdf"
+
+        # Source missing: nothing is created
+        with pytest.raises(FileNotFoundError):
+            copy_inputs_once(run, request_json={}, input_files=[("doc.pdf", source)])
+        assert not dest.exists()
+
+        # Failure mid-copy: the partial destination is removed
+        source.write_bytes(b"PDF on disk")
+
+        def failing_copy(fsrc: object, fdst: object) -> None:
+            raise OSError("disk full")
+
+        with monkeypatch.context() as m:
+            m.setattr(shutil, "copyfileobj", failing_copy)
+            with pytest.raises(OSError, match="disk full"):
+                copy_inputs_once(
+                    run, request_json={}, input_files=[("doc.pdf", source)]
+                )
+        assert not dest.exists()
+
+        copy_inputs_once(run, request_json={}, input_files=[("doc.pdf", source)])
+        assert dest.read_bytes() == b"PDF on disk"
+
     def test_copies_target_files(self, tmp_path: Path) -> None:
         """Test that target_docs files are copied when provided."""
         run = create_run(run_id="test-target", base_dir=tmp_path)
@@ -284,6 +418,19 @@ class TestCopyInputsOnce:
         assert (run.input_docs_dir() / "doc.pdf").read_bytes() == original_doc
         assert (run.input_docs_dir() / "doc.pdf").read_bytes() == b"Original content"
 
+    def test_duplicate_names_keep_first_and_copy_empty(self, tmp_path: Path) -> None:
+        """Test that the first upload of a name wins and empty files are created."""
+        run = create_run(run_id="test-duplicates", base_dir=tmp_path)
+
+        copy_inputs_once(
+            run,
+            request_json={},
+            input_files=[("doc.pdf", b"first"), ("doc.pdf", b"second"), ("e.pdf", b"")],
+        )
+
+        assert (run.input_docs_dir() / "doc.pdf").read_bytes() == b"first"
+        assert (run.input_docs_dir() / "e.pdf").read_bytes() == b""
+
     def test_sanitizes_filenames(self, tmp_path: Path) -> None:
         """Test that dangerous filenames are sanitized."""
         run = create_run(run_id="test-sanitize", base_dir=tmp_path)
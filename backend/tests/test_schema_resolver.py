@@ -25,9 +25,11 @@ from app.schema_resolver import (
     FIELD_ALIASES,
     FIELD_ORDER,
     FIELD_TYPES,
+    MAX_USER_SCHEMA_BYTES,
     _extract_acroform_fields,
     _match_acroform_field_to_key,
     _order_and_cap_fields,
+    _schema_to_dict,
     parse_user_schema,
     resolve_from_acroform,
     resolve_schema,
@@ -319,6 +321,38 @@ class TestAcroFormAmbiguity:
         assert len(warnings) == 1
 
 
+# ---------------------------------------------------------------------------
+# Test: SchemaWarning serialization
+# ---------------------------------------------------------------------------
+
+
+class TestSchemaWarning:
+    """Tests for the SchemaWarning record."""
+
+    def test_to_dict_omits_empty_details(self):
+        """Warnings without details serialize to kind and message only."""
+        warning = SchemaWarning(kind="user_schema_invalid", message="bad")
+
+        assert warning.details == {}
+        assert warning.to_dict() == {"kind": "user_schema_invalid", "message": "bad"}
+
+    def test_to_dict_includes_details(self):
+        """Warnings with details include them in the serialized form."""
+        warning = SchemaWarning(
+            kind="acroform_ambiguous_field",
+            message="ambiguous",
+            details={"field_name": "x"},
+        )
+
+        assert warning.to_dict()["details"] == {"field_name": "x"}
+
+    def test_has_no_instance_dict(self):
+        """SchemaWarning uses slots rather than a per-instance __dict__."""
+        warning = SchemaWarning(kind="k", message="m")
+
+        assert not hasattr(warning, "__dict__")
+
+
 # ---------------------------------------------------------------------------
 # Test: Fallback ordering + max_fields cap
 # ---------------------------------------------------------------------------
@@ -422,6 +456,23 @@ class TestArtifactWriting:
         assert data["schema_source"] == "user_schema"
         assert len(data["resolved_fields"]) == 2
 
+    def test_artifact_matches_model_dump(
+        self, tmp_run: RunPaths, trace: TraceLogger
+    ):
+        """Hand-built schema.json payload matches pydantic's model_dump."""
+        user_schema = make_user_schema_bytes([
+            {"key": "full_name", "label": "Name", "type": "string"},
+            {"key": "dob", "type": "date"},
+            {"key": "unknown_field", "type": "string"},
+        ])
+
+        options = RunOptions()
+        result = resolve_schema(tmp_run, user_schema, options, trace)
+
+        assert _schema_to_dict(result) == result.model_dump()
+        data = read_json(tmp_run.artifact_path("schema.json"))
+        assert data == result.model_dump()
+
 
 # ---------------------------------------------------------------------------
 # Test: Order and cap helper
@@ -524,6 +575,35 @@ class TestParseUserSchema:
         assert result is not None
         assert len(result.resolved_fields) == 0
 
+    def test_oversized_schema_rejected_before_parsing(self):
+        """Payloads above MAX_USER_SCHEMA_BYTES return None with a warning."""
+        schema_bytes = b" " * (MAX_USER_SCHEMA_BYTES + 1)
+        warnings: list[SchemaWarning] = []
+        options = RunOptions()
+
+        result = parse_user_schema(schema_bytes, options, warnings)
+
+        assert result is None
+        assert len(warnings) == 1
+        assert warnings[0].kind == "user_schema_invalid"
+        assert "exceeds limit" in warnings[0].message
+
+    def test_duplicate_keys_last_label_wins(self):
+        """Repeated supported keys collapse to one field using the last label."""
+        schema_bytes = make_user_schema_bytes([
+            {"key": "full_name", "label": "First"},
+            {"key": "dob"},
+            {"key": "full_name", "label": "Second"},
+        ])
+        warnings: list[SchemaWarning] = []
+        options = RunOptions()
+
+        result = parse_user_schema(schema_bytes, options, warnings)
+
+        assert result is not None
+        assert [f.key for f in result.resolved_fields] == ["full_name", "dob"]
+        assert result.resolved_fields[0].label == "Second"
+
     def test_fields_without_key_skipped(self):
         """Field entries without 'key' are skipped."""
         schema_bytes = json.dumps({
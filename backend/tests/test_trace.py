@@ -94,6 +94,34 @@ class TestTraceLogger:
             parsed = json.loads(line)  # Should not raise
             assert isinstance(parsed, dict)
 
+    def test_extend_matches_repeated_append(self, tmp_path: Path) -> None:
+        """Test that extend writes the same lines as appending one by one."""
+        events = [{"index": i, "step": "warn"} for i in range(3)]
+
+        run_a = create_run(run_id="test-extend-a", base_dir=tmp_path)
+        logger_a = TraceLogger(run_a)
+        for event in events:
+            logger_a.append(event)
+
+        run_b = create_run(run_id="test-extend-b", base_dir=tmp_path)
+        logger_b = TraceLogger(run_b)
+        logger_b.append({"index": -1})
+        logger_b.extend(events)
+
+        lines_a = logger_a.trace_path.read_text(encoding="utf-8").splitlines()
+        lines_b = logger_b.trace_path.read_text(encoding="utf-8").splitlines()
+        assert lines_b[1:] == lines_a
+        assert json.loads(lines_b[0]) == {"index": -1}
+
+    def test_extend_empty_is_noop(self, tmp_path: Path) -> None:
+        """Test that extending with no events does not create the file."""
+        run = create_run(run_id="test-extend-empty", base_dir=tmp_path)
+        logger = TraceLogger(run)
+
+        logger.extend([])
+
+        assert not logger.trace_path.exists()
+
     def test_logger_exposes_run_id(self, tmp_path: Path) -> None:
         """Test that logger exposes the run_id property."""
         run = create_run(run_id="my-run-id", base_dir=tmp_path)